@@ -11,29 +11,43 @@ _conn: Optional[sqlite3.Connection] = None
 _cur: Optional[sqlite3.Cursor] = None
 
 
-def init_db():
-    """Initialize the database connection and create tables if they don't exist."""
+def init_db(db_path: Optional[str] = None, template: Optional[sqlite3.Connection] = None):
+    """
+    Initialize the database connection and create tables if they don't exist.
+    
+    Args:
+        db_path: Database file path, or ":memory:" for a RAM-only database
+            (defaults to DB_FILE)
+        template: Already-initialized database to copy the schema from
+            with SQLite's backup API instead of re-running the DDL
+    """
     global _conn, _cur
     
+    db_path = db_path or DB_FILE
+    
     try:
         # Ensure database directory exists
-        db_dir = os.path.dirname(DB_FILE)
+        db_dir = os.path.dirname(db_path)
         if db_dir:
             os.makedirs(db_dir, exist_ok=True)
         
         # Initialize connection
-        _conn = sqlite3.connect(DB_FILE, check_same_thread=False)
+        _conn = sqlite3.connect(db_path, check_same_thread=False)
         _conn.row_factory = sqlite3.Row  # Enable dict-like access
         _cur = _conn.cursor()
         
-        # Create tables
-        create_users_table()
-        create_jobs_table()
-        
-        # Create indexes for better performance
-        create_indexes()
+        if template is not None:
+            # Page-level copy of an existing schema
+            template.backup(_conn)
+        else:
+            # Create tables
+            create_users_table()
+            create_jobs_table()
+            
+            # Create indexes for better performance
+            create_indexes()
         
-        logger.info(f"Database initialized successfully at {DB_FILE}")
+        logger.info(f"Database initialized successfully at {db_path}")
         
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
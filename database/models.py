@@ -50,6 +50,40 @@ def add_user(uid: int, name: str) -> bool:
         return False
 
 
+def bulk_add_users(users: List[Tuple[int, str]]) -> int:
+    """
+    Add many users in a single transaction.
+    
+    Invalid rows are skipped and existing users are ignored, mirroring
+    add_user, but all rows go through one executemany and one commit.
+    
+    Args:
+        users: List of (telegram_id, name) tuples
+        
+    Returns:
+        int: Number of users added
+    """
+    try:
+        joined_at = datetime.utcnow().isoformat()
+        rows = [
+            (uid, name.strip()[:100], "jobs", joined_at)
+            for uid, name in users
+            if isinstance(uid, int) and uid > 0 and name and name.strip()
+        ]
+        if not rows:
+            return 0
+        
+        with get_db_connection() as conn:
+            cur = conn.cursor()
+            cur.executemany("INSERT OR IGNORE INTO users VALUES(?,?,?,?)", rows)
+            logger.info(f"Bulk registered {cur.rowcount} of {len(rows)} users")
+            return cur.rowcount
+            
+    except Exception as e:
+        logger.error(f"Error bulk adding users: {e}")
+        return 0
+
+
 def set_category(uid: int, cat: str) -> bool:
     """
     Set the job category preference for a user.
@@ -169,6 +203,44 @@ def add_job(title: str, company: str, link: str, typ: str) -> bool:
         return False
 
 
+def bulk_add_jobs(jobs: List[Tuple[str, str, str, str]]) -> int:
+    """
+    Add many job listings in a single transaction.
+    
+    Invalid rows are skipped and duplicate links are ignored, mirroring
+    add_job, but all rows go through one executemany and one commit.
+    
+    Args:
+        jobs: List of (title, company, link, type) tuples
+        
+    Returns:
+        int: Number of jobs added
+    """
+    try:
+        valid_types = ["jobs", "remote", "internships", "scholarships"]
+        created_at = datetime.utcnow().isoformat()
+        rows = [
+            (title.strip()[:200], company.strip()[:100], link.strip()[:500], typ, created_at)
+            for title, company, link, typ in jobs
+            if all([title, company, link, typ]) and typ in valid_types
+        ]
+        if not rows:
+            return 0
+        
+        with get_db_connection() as conn:
+            cur = conn.cursor()
+            cur.executemany(
+                "INSERT OR IGNORE INTO jobs(title,company,link,type,created_at) VALUES(?,?,?,?,?)",
+                rows
+            )
+            logger.info(f"Bulk added {cur.rowcount} of {len(rows)} jobs")
+            return cur.rowcount
+        
+    except Exception as e:
+        logger.error(f"Error bulk adding jobs: {e}")
+        return 0
+
+
 def get_latest_jobs(typ: str, limit: int = 10) -> List[Tuple[str, str, str]]:
     """
     Get the latest job listings for a specific type.
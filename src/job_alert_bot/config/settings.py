@@ -1,11 +1,20 @@
 """Configuration management for multiple environments."""
 
 import os
-from typing import Optional, List
+from typing import Optional, List, Mapping
 from dataclasses import dataclass, field
 from enum import Enum
 
 
+# Accepted spellings for boolean environment variables
+_TRUTHY = frozenset({"true", "True", "TRUE", "1", "yes", "Yes", "YES", "on", "On", "ON"})
+
+
+def _split_csv(value: str) -> List[str]:
+    """Split a comma-separated string into stripped, non-empty items."""
+    return [item for item in map(str.strip, value.split(",")) if item]
+
+
 class Environment(Enum):
     """Application environments."""
     DEVELOPMENT = "development"
@@ -101,82 +110,84 @@ class Config:
     security: SecurityConfig = field(default_factory=SecurityConfig)
     
     @classmethod
-    def from_env(cls) -> 'Config':
-        """Load configuration from environment variables."""
-        env = Environment(os.getenv("ENVIRONMENT", "development"))
+    def from_env(cls, environ: Optional[Mapping[str, str]] = None) -> 'Config':
+        """Load configuration from environment variables.
+        
+        Args:
+            environ: Mapping to read variables from (defaults to ``os.environ``)
+            
+        Raises:
+            ValueError: If required Telegram settings are missing
+        """
+        getenv = (os.environ if environ is None else environ).get
+        env = Environment(getenv("ENVIRONMENT", "development"))
         
         # Determine debug mode
-        debug = os.getenv("DEBUG", "false").lower() == "true"
+        debug = getenv("DEBUG", "false").strip() in _TRUTHY
         if env == Environment.DEVELOPMENT:
             debug = True
             
         # Telegram config
         telegram = TelegramConfig(
-            token=os.getenv("TELEGRAM_TOKEN", ""),
-            admin_id=int(os.getenv("ADMIN_ID", "0")),
-            webhook_base_url=os.getenv("WEBHOOK_BASE_URL", ""),
-            webhook_token=os.getenv("WEBHOOK_TOKEN", ""),
+            token=getenv("TELEGRAM_TOKEN", ""),
+            admin_id=int(getenv("ADMIN_ID", "0")),
+            webhook_base_url=getenv("WEBHOOK_BASE_URL", ""),
+            webhook_token=getenv("WEBHOOK_TOKEN", ""),
         )
         
         # Database config
         database = DatabaseConfig(
-            db_file=os.getenv("DB_FILE", "database.db"),
-            max_connections=int(os.getenv("DB_MAX_CONNECTIONS", "10")),
-            timeout=float(os.getenv("DB_TIMEOUT", "30.0")),
-            enable_wal=os.getenv("DB_ENABLE_WAL", "true").lower() == "true",
+            db_file=getenv("DB_FILE", "database.db"),
+            max_connections=int(getenv("DB_MAX_CONNECTIONS", "10")),
+            timeout=float(getenv("DB_TIMEOUT", "30.0")),
+            enable_wal=getenv("DB_ENABLE_WAL", "true").strip() in _TRUTHY,
         )
         
         # Scheduler config
         scheduler = SchedulerConfig(
-            timezone=os.getenv("TIMEZONE", "Asia/Kolkata"),
-            scrape_interval_hours=int(os.getenv("SCRAPE_INTERVAL_HOURS", "3")),
-            daily_alert_hour=int(os.getenv("DAILY_ALERT_HOUR", "9")),
-            max_concurrent_scrapers=int(os.getenv("MAX_CONCURRENT_SCRAPERS", "3")),
+            timezone=getenv("TIMEZONE", "Asia/Kolkata"),
+            scrape_interval_hours=int(getenv("SCRAPE_INTERVAL_HOURS", "3")),
+            daily_alert_hour=int(getenv("DAILY_ALERT_HOUR", "9")),
+            max_concurrent_scrapers=int(getenv("MAX_CONCURRENT_SCRAPERS", "3")),
         )
         
         # Messaging config
         messaging = MessagingConfig(
-            send_batch_size=int(os.getenv("SEND_BATCH_SIZE", "25")),
-            send_batch_sleep=float(os.getenv("SEND_BATCH_SLEEP", "0.6")),
-            max_message_length=int(os.getenv("MAX_MESSAGE_LENGTH", "4000")),
-            rate_limit_per_second=int(os.getenv("RATE_LIMIT_PER_SECOND", "30")),
+            send_batch_size=int(getenv("SEND_BATCH_SIZE", "25")),
+            send_batch_sleep=float(getenv("SEND_BATCH_SLEEP", "0.6")),
+            max_message_length=int(getenv("MAX_MESSAGE_LENGTH", "4000")),
+            rate_limit_per_second=int(getenv("RATE_LIMIT_PER_SECOND", "30")),
         )
         
         # Scraper config
         scraper = ScraperConfig(
-            request_timeout=int(os.getenv("SCRAPER_TIMEOUT", "30")),
-            max_retries=int(os.getenv("SCRAPER_MAX_RETRIES", "3")),
-            retry_delay=float(os.getenv("SCRAPER_RETRY_DELAY", "1.0")),
-            user_agent=os.getenv(
+            request_timeout=int(getenv("SCRAPER_TIMEOUT", "30")),
+            max_retries=int(getenv("SCRAPER_MAX_RETRIES", "3")),
+            retry_delay=float(getenv("SCRAPER_RETRY_DELAY", "1.0")),
+            user_agent=getenv(
                 "SCRAPER_USER_AGENT",
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
             ),
-            rate_limit_delay=float(os.getenv("SCRAPER_RATE_LIMIT_DELAY", "0.5")),
-            circuit_breaker_threshold=int(os.getenv("CIRCUIT_BREAKER_THRESHOLD", "5")),
-            circuit_breaker_timeout=float(os.getenv("CIRCUIT_BREAKER_TIMEOUT", "60.0")),
+            rate_limit_delay=float(getenv("SCRAPER_RATE_LIMIT_DELAY", "0.5")),
+            circuit_breaker_threshold=int(getenv("CIRCUIT_BREAKER_THRESHOLD", "5")),
+            circuit_breaker_timeout=float(getenv("CIRCUIT_BREAKER_TIMEOUT", "60.0")),
         )
         
         # Monitoring config
         monitoring = MonitoringConfig(
-            log_level=os.getenv("LOG_LEVEL", "INFO"),
-            json_logging=os.getenv("JSON_LOGGING", "true").lower() == "true",
-            enable_metrics=os.getenv("ENABLE_METRICS", "true").lower() == "true",
-            metrics_port=int(os.getenv("METRICS_PORT", "9090")),
-            health_check_interval=int(os.getenv("HEALTH_CHECK_INTERVAL", "30")),
+            log_level=getenv("LOG_LEVEL", "INFO"),
+            json_logging=getenv("JSON_LOGGING", "true").strip() in _TRUTHY,
+            enable_metrics=getenv("ENABLE_METRICS", "true").strip() in _TRUTHY,
+            metrics_port=int(getenv("METRICS_PORT", "9090")),
+            health_check_interval=int(getenv("HEALTH_CHECK_INTERVAL", "30")),
         )
         
         # Security config
-        allowed_hosts_str = os.getenv("ALLOWED_HOSTS", "")
-        allowed_hosts = [h.strip() for h in allowed_hosts_str.split(",") if h.strip()]
-        
-        cors_origins_str = os.getenv("CORS_ORIGINS", "*")
-        cors_origins = [o.strip() for o in cors_origins_str.split(",") if o.strip()]
-        
         security = SecurityConfig(
-            allowed_hosts=allowed_hosts,
-            cors_origins=cors_origins,
-            enable_ssl=os.getenv("ENABLE_SSL", "true").lower() == "true",
-            max_request_size=int(os.getenv("MAX_REQUEST_SIZE", str(10 * 1024 * 1024))),
+            allowed_hosts=_split_csv(getenv("ALLOWED_HOSTS", "")),
+            cors_origins=_split_csv(getenv("CORS_ORIGINS", "*")),
+            enable_ssl=getenv("ENABLE_SSL", "true").strip() in _TRUTHY,
+            max_request_size=int(getenv("MAX_REQUEST_SIZE", str(10 * 1024 * 1024))),
         )
         
         return cls(
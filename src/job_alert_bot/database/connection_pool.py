@@ -1,13 +1,17 @@
 """Thread-safe database connection pool with transaction management."""
 
+import itertools
+import os
 import sqlite3
 import threading
 import queue
 import logging
-from typing import Optional, Generator, Any
+import time
+from collections import deque
+from typing import Optional, Generator, Any, Deque, List
 from contextlib import contextmanager
 from dataclasses import dataclass
-from utils.structured_logging import get_logger
+from job_alert_bot.utils.structured_logging import get_logger
 
 logger = get_logger(__name__)
 
@@ -19,6 +23,7 @@ class PoolConfig:
     timeout: float = 30.0
     check_same_thread: bool = False
     isolation_level: Optional[str] = None  # None = autocommit mode
+    shard_pool: bool = False  # Split idle connections across per-thread shards
 
 
 class ConnectionPool:
@@ -34,6 +39,19 @@ class ConnectionPool:
         self._connections_created = 0
         self._local = threading.local()
         
+        # Optional sharded layout: idle connections live in per-thread-group
+        # deques, each with its own lock, instead of the single queue above.
+        self._shard_count = 0
+        self._shards: List[Deque[sqlite3.Connection]] = []
+        self._shard_locks: List[threading.Lock] = []
+        self._available = threading.Condition(self._lock)
+        self._waiters = 0
+        self._shard_ids = itertools.count()
+        if self.config.shard_pool:
+            self._shard_count = max(1, min(self.config.max_connections, os.cpu_count() or 4))
+            self._shards = [deque() for _ in range(self._shard_count)]
+            self._shard_locks = [threading.Lock() for _ in range(self._shard_count)]
+        
     def _create_connection(self) -> sqlite3.Connection:
         """Create a new database connection."""
         conn = sqlite3.connect(
@@ -61,6 +79,9 @@ class ConnectionPool:
         if hasattr(self._local, 'connection') and self._local.connection:
             return self._local.connection
         
+        if self._shard_count:
+            return self._get_sharded_connection()
+        
         try:
             # Try to get from pool without blocking
             conn = self._pool.get_nowait()
@@ -76,6 +97,69 @@ class ConnectionPool:
             conn = self._pool.get(timeout=self.config.timeout)
             return conn
     
+    def _shard_index(self) -> int:
+        """Return the calling thread's shard, assigning one round-robin on first use.
+        
+        Thread idents are page-aligned addresses on Linux, so ``ident % n``
+        would put every thread on shard 0.
+        """
+        index = getattr(self._local, 'shard_index', None)
+        if index is None:
+            index = next(self._shard_ids) % self._shard_count
+            self._local.shard_index = index
+        return index
+    
+    def _take_from_shards(self) -> Optional[sqlite3.Connection]:
+        """Pop an idle connection, trying the caller's shard before stealing."""
+        start = self._shard_index()
+        for offset in range(self._shard_count):
+            index = (start + offset) % self._shard_count
+            shard = self._shards[index]
+            if not shard:
+                continue
+            with self._shard_locks[index]:
+                if shard:
+                    return shard.pop()
+        return None
+    
+    def _get_sharded_connection(self) -> sqlite3.Connection:
+        """Get a connection when the pool is sharded."""
+        conn = self._take_from_shards()
+        if conn is not None:
+            logger.debug("Got connection from pool shard")
+            return conn
+        
+        with self._lock:
+            if self._connections_created < self.config.max_connections:
+                return self._create_connection()
+            
+            # Wait for a connection to be returned to any shard
+            logger.debug("Waiting for available connection...")
+            deadline = time.monotonic() + self.config.timeout
+            self._waiters += 1
+            try:
+                while True:
+                    conn = self._take_from_shards()
+                    if conn is not None:
+                        return conn
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise queue.Empty
+                    self._available.wait(remaining)
+            finally:
+                self._waiters -= 1
+    
+    def _put_sharded_connection(self, conn: sqlite3.Connection) -> None:
+        """Return a connection to the caller's shard and wake any waiter."""
+        index = self._shard_index()
+        with self._shard_locks[index]:
+            self._shards[index].append(conn)
+        logger.debug("Returned connection to pool shard")
+        
+        if self._waiters:
+            with self._lock:
+                self._available.notify()
+    
     def return_connection(self, conn: sqlite3.Connection, is_broken: bool = False) -> None:
         """Return a connection to the pool.
         
@@ -96,6 +180,10 @@ class ConnectionPool:
             logger.debug("Closed broken connection")
             return
         
+        if self._shard_count:
+            self._put_sharded_connection(conn)
+            return
+        
         try:
             self._pool.put_nowait(conn)
             logger.debug("Returned connection to pool")
@@ -113,6 +201,13 @@ class ConnectionPool:
                     conn.close()
                 except Exception as e:
                     logger.warning(f"Error closing connection: {e}")
+            for index, shard in enumerate(self._shards):
+                with self._shard_locks[index]:
+                    while shard:
+                        try:
+                            shard.pop().close()
+                        except Exception as e:
+                            logger.warning(f"Error closing connection: {e}")
             self._connections_created = 0
             logger.info("All connections closed")
     
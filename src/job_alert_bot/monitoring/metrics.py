@@ -197,16 +197,19 @@ class MetricsCollector:
                 
         return results
     
-    def get_prometheus_metrics(self) -> tuple[str, str]:
+    def get_prometheus_metrics(self) -> tuple[bytes, str]:
         """Get Prometheus-formatted metrics.
         
+        The payload is returned as raw bytes so the HTTP layer can write it
+        directly without a decode/re-encode round trip.
+        
         Returns:
             Tuple of (content, content_type)
         """
         if not PROMETHEUS_AVAILABLE:
-            return "# Prometheus client not installed", "text/plain"
+            return b"# Prometheus client not installed", "text/plain"
         
-        return generate_latest().decode('utf-8'), CONTENT_TYPE_LATEST
+        return generate_latest(), CONTENT_TYPE_LATEST
 
 
 # Global metrics collector
@@ -230,6 +233,9 @@ def get_metrics_collector() -> MetricsCollector:
 
 def track_request_duration(method: str, endpoint: str):
     """Decorator to track request duration."""
+    if not PROMETHEUS_AVAILABLE:
+        return lambda func: func
+    
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         @wraps(func)
         async def wrapper(*args, **kwargs):
@@ -250,15 +256,20 @@ def track_request_duration(method: str, endpoint: str):
 
 
 def track_scraper_duration(source: str):
-    """Decorator to track scraper execution."""
+    """Decorator to track scraper execution.
+    
+    The decorated coroutine must return the number of jobs added (int).
+    """
+    if not PROMETHEUS_AVAILABLE:
+        return lambda func: func
+    
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         @wraps(func)
         async def wrapper(*args, **kwargs):
             start = time.time()
             try:
                 result = await func(*args, **kwargs)
-                if isinstance(result, int):
-                    SCRAPER_JOBS_ADDED.labels(source=source).inc(result)
+                SCRAPER_JOBS_ADDED.labels(source=source).inc(result)
                 return result
             except Exception as e:
                 SCRAPER_ERRORS.labels(source=source, error_type=type(e).__name__).inc()
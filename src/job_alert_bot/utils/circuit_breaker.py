@@ -1,6 +1,5 @@
 """Circuit breaker pattern implementation for resilient API calls."""
 
-import asyncio
 import time
 from enum import Enum
 from typing import Callable, Optional, TypeVar, Any
@@ -18,7 +17,7 @@ class CircuitState(Enum):
     HALF_OPEN = "half_open"  # Testing if service recovered
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CircuitBreakerConfig:
     """Configuration for circuit breaker."""
     failure_threshold: int = 5
@@ -28,7 +27,12 @@ class CircuitBreakerConfig:
     
 
 class CircuitBreaker:
-    """Circuit breaker for protecting external API calls."""
+    """Circuit breaker for protecting external API calls.
+    
+    State is only mutated from synchronous code with no ``await`` in between,
+    so each check-and-update runs atomically on the event loop and no lock is
+    needed on the call path.
+    """
     
     def __init__(self, name: str, config: Optional[CircuitBreakerConfig] = None):
         self.name = name
@@ -36,64 +40,69 @@ class CircuitBreaker:
         self.state = CircuitState.CLOSED
         self.failure_count = 0
         self.success_count = 0
+        # Monotonic time of the last failure, used to time recovery
         self.last_failure_time: Optional[float] = None
+        # Wall-clock timestamp of the same failure, for reporting
+        self.last_failure_at: Optional[float] = None
         self.half_open_calls = 0
-        self._lock = asyncio.Lock()
         
     async def call(self, func: Callable[..., T], *args, **kwargs) -> T:
         """Execute function with circuit breaker protection."""
-        async with self._lock:
-            await self._transition_state()
-            
-            if self.state == CircuitState.OPEN:
-                raise CircuitBreakerOpenError(f"Circuit breaker '{self.name}' is OPEN")
-            
-            if self.state == CircuitState.HALF_OPEN:
-                if self.half_open_calls >= self.config.half_open_max_calls:
-                    raise CircuitBreakerOpenError(f"Circuit breaker '{self.name}' half-open limit reached")
-                self.half_open_calls += 1
+        # CLOSED admits every call, so only the other states need checking
+        if self.state is not CircuitState.CLOSED:
+            self._before_call()
         
-        # Execute outside lock
         try:
             result = await func(*args, **kwargs)
-            await self._on_success()
-            return result
-        except Exception as e:
-            await self._on_failure()
+        except Exception:
+            self._on_failure()
             raise
+        self._on_success()
+        return result
+    
+    def _before_call(self) -> None:
+        """Admit or reject a call based on the current state."""
+        self._transition_state()
+        
+        if self.state == CircuitState.OPEN:
+            raise CircuitBreakerOpenError(f"Circuit breaker '{self.name}' is OPEN")
+        
+        if self.state == CircuitState.HALF_OPEN:
+            if self.half_open_calls >= self.config.half_open_max_calls:
+                raise CircuitBreakerOpenError(f"Circuit breaker '{self.name}' half-open limit reached")
+            self.half_open_calls += 1
             
-    async def _transition_state(self) -> None:
+    def _transition_state(self) -> None:
         """Check and transition circuit state."""
         if self.state == CircuitState.OPEN:
-            if self.last_failure_time and (time.time() - self.last_failure_time) >= self.config.recovery_timeout:
+            if self.last_failure_time and (time.monotonic() - self.last_failure_time) >= self.config.recovery_timeout:
                 logger.info(f"Circuit breaker '{self.name}' transitioning to HALF_OPEN")
                 self.state = CircuitState.HALF_OPEN
                 self.half_open_calls = 0
                 self.success_count = 0
                 
-    async def _on_success(self) -> None:
+    def _on_success(self) -> None:
         """Handle successful call."""
-        async with self._lock:
-            if self.state == CircuitState.HALF_OPEN:
-                self.success_count += 1
-                if self.success_count >= self.config.success_threshold:
-                    logger.info(f"Circuit breaker '{self.name}' transitioning to CLOSED")
-                    self._reset()
-            else:
-                self.failure_count = 0
+        if self.state == CircuitState.HALF_OPEN:
+            self.success_count += 1
+            if self.success_count >= self.config.success_threshold:
+                logger.info(f"Circuit breaker '{self.name}' transitioning to CLOSED")
+                self._reset()
+        elif self.failure_count:
+            self.failure_count = 0
                 
-    async def _on_failure(self) -> None:
+    def _on_failure(self) -> None:
         """Handle failed call."""
-        async with self._lock:
-            self.failure_count += 1
-            self.last_failure_time = time.time()
-            
-            if self.state == CircuitState.HALF_OPEN:
-                logger.warning(f"Circuit breaker '{self.name}' transitioning to OPEN (half-open failure)")
-                self.state = CircuitState.OPEN
-            elif self.failure_count >= self.config.failure_threshold:
-                logger.warning(f"Circuit breaker '{self.name}' transitioning to OPEN ({self.failure_count} failures)")
-                self.state = CircuitState.OPEN
+        self.failure_count += 1
+        self.last_failure_time = time.monotonic()
+        self.last_failure_at = time.time()
+        
+        if self.state == CircuitState.HALF_OPEN:
+            logger.warning(f"Circuit breaker '{self.name}' transitioning to OPEN (half-open failure)")
+            self.state = CircuitState.OPEN
+        elif self.failure_count >= self.config.failure_threshold:
+            logger.warning(f"Circuit breaker '{self.name}' transitioning to OPEN ({self.failure_count} failures)")
+            self.state = CircuitState.OPEN
                 
     def _reset(self) -> None:
         """Reset circuit breaker to initial state."""
@@ -101,16 +110,21 @@ class CircuitBreaker:
         self.failure_count = 0
         self.success_count = 0
         self.last_failure_time = None
+        self.last_failure_at = None
         self.half_open_calls = 0
         
     def get_state(self) -> dict:
-        """Get current circuit breaker state."""
+        """Get current circuit breaker state.
+        
+        ``last_failure_time`` is a wall-clock Unix timestamp, not the
+        monotonic reading used internally for recovery timing.
+        """
         return {
             "name": self.name,
             "state": self.state.value,
             "failure_count": self.failure_count,
             "success_count": self.success_count,
-            "last_failure_time": self.last_failure_time,
+            "last_failure_time": self.last_failure_at,
         }
 
 
@@ -124,10 +138,16 @@ _circuit_breakers: dict[str, CircuitBreaker] = {}
 
 
 def get_circuit_breaker(name: str, config: Optional[CircuitBreakerConfig] = None) -> CircuitBreaker:
-    """Get or create circuit breaker."""
-    if name not in _circuit_breakers:
-        _circuit_breakers[name] = CircuitBreaker(name, config)
-    return _circuit_breakers[name]
+    """Get or create circuit breaker.
+    
+    Each name gets its own breaker, so state for one external service never
+    contends with another. Creation goes through ``dict.setdefault`` so two
+    concurrent first lookups always end up sharing a single instance.
+    """
+    breaker = _circuit_breakers.get(name)
+    if breaker is None:
+        breaker = _circuit_breakers.setdefault(name, CircuitBreaker(name, config))
+    return breaker
 
 
 def circuit_breaker(name: str, config: Optional[CircuitBreakerConfig] = None):
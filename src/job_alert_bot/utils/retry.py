@@ -2,6 +2,8 @@
 
 import asyncio
 import random  # nosec B311 - Not used for cryptography, only for jitter
+import time
+from collections import OrderedDict
 from typing import Callable, TypeVar, Optional, Tuple, Type, Any
 from functools import wraps
 from dataclasses import dataclass
@@ -10,15 +12,15 @@ from utils.logger import logger
 T = TypeVar('T')
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RetryConfig:
     """Configuration for retry mechanism."""
     max_attempts: int = 3
     base_delay: float = 1.0
     max_delay: float = 60.0
     exponential_base: float = 2.0
-    jitter: bool = True
-    jitter_max: float = 1.0
+    jitter: bool = True  # "Full jitter": sleep a random fraction of the backoff
+    jitter_max: float = 1.0  # Unused since full jitter; kept for compatibility
     retryable_exceptions: Tuple[Type[Exception], ...] = (Exception,)
     on_retry: Optional[Callable[[Exception, int], None]] = None
 
@@ -54,36 +56,42 @@ async def retry_with_backoff(
     config = config or RetryConfig()
     last_exception: Optional[Exception] = None
     
-    for attempt in range(1, config.max_attempts + 1):
+    # Bind config fields to locals once for the attempt loop
+    max_attempts = config.max_attempts
+    base_delay = config.base_delay
+    exponential_base = config.exponential_base
+    max_delay = config.max_delay
+    jitter = config.jitter
+    retryable_exceptions = config.retryable_exceptions
+    on_retry = config.on_retry
+    
+    # Backoff ceiling for the next retry, grown by multiplication each attempt
+    exp_delay = min(base_delay, max_delay)
+    
+    for attempt in range(1, max_attempts + 1):
         try:
             return await func(*args, **kwargs)
-        except config.retryable_exceptions as e:
+        except retryable_exceptions as e:
             last_exception = e
             
-            if attempt == config.max_attempts:
-                logger.error(f"All {config.max_attempts} retry attempts exhausted")
+            if attempt == max_attempts:
+                logger.error(f"All {max_attempts} retry attempts exhausted")
                 raise RetryExhaustedError(
-                    f"Failed after {config.max_attempts} attempts",
+                    f"Failed after {max_attempts} attempts",
                     last_exception=e
                 ) from e
             
-            # Calculate delay with exponential backoff
-            delay = min(
-                config.base_delay * (config.exponential_base ** (attempt - 1)),
-                config.max_delay
-            )
-            
-            # Add jitter to prevent thundering herd
-            if config.jitter:
-                delay += random.uniform(0, config.jitter_max)  # nosec B311
+            # Full jitter spreads retries over [0, exp_delay] to prevent thundering herd
+            delay = random.uniform(0, exp_delay) if jitter else exp_delay  # nosec B311
+            exp_delay = min(exp_delay * exponential_base, max_delay)
             
             logger.warning(
-                f"Attempt {attempt}/{config.max_attempts} failed: {e}. "
+                f"Attempt {attempt}/{max_attempts} failed: {e}. "
                 f"Retrying in {delay:.2f}s..."
             )
             
-            if config.on_retry:
-                config.on_retry(e, attempt)
+            if on_retry:
+                on_retry(e, attempt)
             
             await asyncio.sleep(delay)
     
@@ -123,6 +131,82 @@ def retry(
     return decorator
 
 
+def cached_retry(
+    max_attempts: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 60.0,
+    retryable_exceptions: Tuple[Type[Exception], ...] = (Exception,),
+    on_retry: Optional[Callable[[Exception, int], None]] = None,
+    ttl: float = 300.0,
+    negative_ttl: float = 60.0,
+    maxsize: int = 1024
+):
+    """Decorator that caches results in front of the retry logic.
+    
+    Calls with the same arguments within ``ttl`` seconds return the cached
+    result without touching the network. Exhausted retries are cached for
+    ``negative_ttl`` seconds so follow-up calls fail fast instead of burning
+    another full retry budget. Calls with unhashable arguments bypass the cache.
+    
+    Args:
+        max_attempts: Maximum number of retry attempts
+        base_delay: Initial delay between retries
+        max_delay: Maximum delay between retries
+        retryable_exceptions: Exceptions that should trigger a retry
+        on_retry: Callback function called on each retry
+        ttl: Seconds a successful result stays cached
+        negative_ttl: Seconds a RetryExhaustedError stays cached
+        maxsize: Maximum number of cached entries (least recently used evicted)
+    """
+    config = RetryConfig(
+        max_attempts=max_attempts,
+        base_delay=base_delay,
+        max_delay=max_delay,
+        retryable_exceptions=retryable_exceptions,
+        on_retry=on_retry
+    )
+    
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        # key -> (expires_at, succeeded, result or exception)
+        cache: "OrderedDict[Any, Tuple[float, bool, Any]]" = OrderedDict()
+        
+        def store(key: Any, expires_at: float, succeeded: bool, value: Any) -> None:
+            cache[key] = (expires_at, succeeded, value)
+            cache.move_to_end(key)
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+        
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> T:
+            try:
+                key = (args, frozenset(kwargs.items()))
+                entry = cache.get(key)
+            except TypeError:
+                return await retry_with_backoff(func, config, *args, **kwargs)
+            
+            now = time.monotonic()
+            if entry is not None:
+                expires_at, succeeded, value = entry
+                if expires_at > now:
+                    cache.move_to_end(key)
+                    if succeeded:
+                        return value
+                    raise RetryExhaustedError(str(value), last_exception=value.last_exception)
+                del cache[key]
+            
+            try:
+                result = await retry_with_backoff(func, config, *args, **kwargs)
+            except RetryExhaustedError as e:
+                store(key, time.monotonic() + negative_ttl, False, e)
+                raise
+            store(key, time.monotonic() + ttl, True, result)
+            return result
+        
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+        return wrapper
+    return decorator
+
+
 class AsyncRetryable:
     """Context manager for retryable operations."""
     
@@ -130,6 +214,7 @@ class AsyncRetryable:
         self.config = config or RetryConfig()
         self.attempt = 0
         self.last_exception: Optional[Exception] = None
+        self._exp_delay = min(self.config.base_delay, self.config.max_delay)
         
     async def __aenter__(self) -> 'AsyncRetryable':
         return self
@@ -148,13 +233,9 @@ class AsyncRetryable:
             logger.error(f"All {self.config.max_attempts} retry attempts exhausted")
             return False
         
-        delay = min(
-            self.config.base_delay * (self.config.exponential_base ** (self.attempt - 1)),
-            self.config.max_delay
-        )
-        
-        if self.config.jitter:
-            delay += random.uniform(0, self.config.jitter_max)  # nosec B311
+        exp_delay = self._exp_delay
+        delay = random.uniform(0, exp_delay) if self.config.jitter else exp_delay  # nosec B311
+        self._exp_delay = min(exp_delay * self.config.exponential_base, self.config.max_delay)
         
         logger.warning(
             f"Attempt {self.attempt}/{self.config.max_attempts} failed: {exc_val}. "
@@ -1,34 +1,101 @@
 """Structured logging with correlation IDs for request tracing."""
 
+import itertools
 import logging
 import json
-import uuid
+import os
+import time
 import sys
 from typing import Any, Optional, Dict
 from contextvars import ContextVar
-from datetime import datetime
+from functools import cached_property
 from pythonjsonlogger import jsonlogger
 
+try:
+    import orjson
+    _ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+except ImportError:
+    orjson = None
+
 # Context variable for correlation ID
 correlation_id: ContextVar[Optional[str]] = ContextVar('correlation_id', default=None)
 
+# Bound once so per-record lookups skip the attribute access
+_get_correlation_id = correlation_id.get
+
+# Per-process sequence number for generated correlation IDs
+_correlation_counter = itertools.count()
+
+
+def _new_correlation_id() -> str:
+    """Generate a cheap, time-sortable correlation ID.
+    
+    Format is ``<time_ns>-<pid>-<sequence>`` in hex. Log correlation does
+    not need cryptographic randomness, so this avoids a uuid4() per request.
+    """
+    return f"{time.time_ns():x}-{os.getpid():x}-{next(_correlation_counter):x}"
+
 
-class CorrelationIdFilter(logging.Filter):
-    """Add correlation ID to log records."""
+def _install_correlation_id_factory() -> None:
+    """Stamp the correlation ID onto every LogRecord at creation time.
+    
+    Wraps the current record factory once, replacing a per-handler filter
+    callback on every record.
+    """
+    base_factory = logging.getLogRecordFactory()
+    if getattr(base_factory, "_adds_correlation_id", False):
+        return
+    
+    def factory(*args: Any, **kwargs: Any) -> logging.LogRecord:
+        record = base_factory(*args, **kwargs)
+        record.correlation_id = _get_correlation_id() or "no-correlation-id"
+        return record
     
-    def filter(self, record: logging.LogRecord) -> bool:
-        record.correlation_id = correlation_id.get() or "no-correlation-id"
-        return True
+    factory._adds_correlation_id = True  # type: ignore[attr-defined]
+    logging.setLogRecordFactory(factory)
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last formatted log timestamp,
+# shared by all formatters; replaced as a whole tuple so readers never see a
+# half-updated pair
+_ts_cache: tuple = (None, "")
 
 
 class CustomJsonFormatter(jsonlogger.JsonFormatter):
     """Custom JSON formatter for structured logging."""
     
+    def _format_timestamp(self, created: float) -> str:
+        """Format a record's creation time as an ISO-8601 UTC string.
+        
+        The date/time part is only rebuilt when the second changes; the
+        microseconds are appended directly.
+        """
+        global _ts_cache
+        second = int(created)
+        cached_second, prefix = _ts_cache
+        if cached_second != second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            _ts_cache = (second, prefix)
+        return f"{prefix}.{int((created - second) * 1_000_000):06d}"
+    
+    @cached_property
+    def _orjson_default(self) -> Any:
+        """Fallback serializer for types orjson does not handle natively."""
+        return self.json_default or self.json_encoder().default
+    
+    def jsonify_log_record(self, log_record: Dict[str, Any]) -> str:
+        """Serialize the log record, using orjson when it is installed."""
+        if orjson is None:
+            return super().jsonify_log_record(log_record)
+        return orjson.dumps(
+            log_record, default=self._orjson_default, option=_ORJSON_OPTIONS
+        ).decode()
+    
     def add_fields(self, log_record: Dict[str, Any], record: logging.LogRecord, message_dict: Dict[str, Any]) -> None:
         super().add_fields(log_record, record, message_dict)
         
         # Add timestamp
-        log_record['timestamp'] = datetime.utcnow().isoformat()
+        log_record['timestamp'] = self._format_timestamp(record.created)
         log_record['level'] = record.levelname
         log_record['logger'] = record.name
         log_record['source'] = f"{record.filename}:{record.lineno}"
@@ -42,6 +109,13 @@ class CustomJsonFormatter(jsonlogger.JsonFormatter):
         log_record['version'] = '2.0.0'
 
 
+def _dumps(obj: Any) -> str:
+    """Serialize to a JSON string, using orjson when it is installed."""
+    if orjson is None:
+        return json.dumps(obj)
+    return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode()
+
+
 def setup_structured_logging(log_level: str = "INFO", json_format: bool = True) -> logging.Logger:
     """Setup structured logging configuration.
     
@@ -62,8 +136,8 @@ def setup_structured_logging(log_level: str = "INFO", json_format: bool = True)
     handler = logging.StreamHandler(sys.stdout)
     handler.setLevel(getattr(logging, log_level.upper()))
     
-    # Add correlation ID filter
-    handler.addFilter(CorrelationIdFilter())
+    # Add correlation ID to every record
+    _install_correlation_id_factory()
     
     if json_format:
         # JSON formatter
@@ -84,9 +158,9 @@ def setup_structured_logging(log_level: str = "INFO", json_format: bool = True)
 
 def get_correlation_id() -> str:
     """Get or create correlation ID for current context."""
-    cid = correlation_id.get()
+    cid = _get_correlation_id()
     if cid is None:
-        cid = str(uuid.uuid4())
+        cid = _new_correlation_id()
         correlation_id.set(cid)
     return cid
 
@@ -101,7 +175,7 @@ def set_correlation_id(cid: Optional[str] = None) -> str:
         The correlation ID
     """
     if cid is None:
-        cid = str(uuid.uuid4())
+        cid = _new_correlation_id()
     correlation_id.set(cid)
     return cid
 
@@ -112,10 +186,15 @@ def clear_correlation_id() -> None:
 
 
 class LogContext:
-    """Context manager for correlation ID scoping."""
+    """Context manager for correlation ID scoping.
+    
+    Entering sets the ID in the current context only; exiting restores the
+    previous value through the ContextVar token, so nesting never copies the
+    surrounding context.
+    """
     
     def __init__(self, cid: Optional[str] = None):
-        self.cid = cid or str(uuid.uuid4())
+        self.cid = cid or _new_correlation_id()
         self.token: Optional[Any] = None
         
     def __enter__(self) -> 'LogContext':
@@ -123,8 +202,9 @@ class LogContext:
         return self
         
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        if self.token:
+        if self.token is not None:
             correlation_id.reset(self.token)
+            self.token = None
 
 
 class StructuredLogger:
@@ -141,7 +221,7 @@ class StructuredLogger:
                 'message': message,
                 'extra': extra
             }
-            self.logger.log(level, json.dumps(structured_msg))
+            self.logger.log(level, _dumps(structured_msg))
         else:
             self.logger.log(level, message)
             
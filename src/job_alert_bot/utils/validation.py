@@ -1,20 +1,242 @@
 """Input validation and sanitization utilities."""
 
+import asyncio
 import re
-import html
-from typing import Optional, List, Tuple, Any
+import threading
 from dataclasses import dataclass
-from urllib.parse import urlparse
+from functools import lru_cache
+from typing import Optional, List, Tuple, Any, NamedTuple, Iterator, Union, overload
 
+try:
+    # Linear-time DFA engine; immune to catastrophic backtracking
+    import re2 as _sql_re
+except ImportError:
+    _sql_re = re
 
-@dataclass
-class ValidationResult:
-    """Result of validation operation."""
+try:
+    # Aho-Corasick automaton for a single-pass literal prefilter
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    # Hyperscan compiles every SQL injection pattern into one multi-pattern DFA
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Single-pass equivalent of html.escape(value, quote=True)
+_HTML_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+
+def _fast_escape(value: str) -> str:
+    """HTML-escape a string with one str.translate pass.
+    
+    Clean strings are returned as-is after five memchr-speed membership
+    checks, which is much cheaper than translating them character by character.
+    """
+    if "&" in value or "<" in value or ">" in value or '"' in value or "'" in value:
+        return value.translate(_HTML_ESCAPE_TABLE)
+    return value
+
+
+# Lowercase literals of which every SQL_INJECTION_PATTERNS match contains at least one
+_SQL_INJECTION_NEEDLES = (
+    "'", "%27", "--", "%23", "#", ";", "%3b", "exec",
+    "union select", "insert into", "delete from", "drop table",
+)
+
+
+def _build_sql_prefilter() -> Optional[Any]:
+    """Build the literal prefilter automaton, or None without pyahocorasick."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for needle in _SQL_INJECTION_NEEDLES:
+        automaton.add_word(needle, needle)
+    automaton.make_automaton()
+    return automaton
+
+
+_SQL_PREFILTER = _build_sql_prefilter()
+
+
+def _has_sql_literal(value: str) -> bool:
+    """Check ASCII text for any SQL injection needle.
+    
+    Uses the Aho-Corasick automaton when available; otherwise each needle is
+    probed with ``in``, which CPython runs as a C substring search. Either way
+    the cost is linear, unlike the fused regex on long runs of word characters.
+    """
+    lowered = value.lower()
+    if _SQL_PREFILTER is not None:
+        return next(_SQL_PREFILTER.iter(lowered), None) is not None
+    for needle in _SQL_INJECTION_NEEDLES:
+        if needle in lowered:
+            return True
+    return False
+
+
+def _build_sql_scanner(patterns: List[str]) -> Optional[Any]:
+    """Compile patterns into a caseless Hyperscan block database, or None."""
+    if hyperscan is None:
+        return None
+    # Python's str \s also matches the \x1c-\x1f separators; Hyperscan's doesn't
+    expressions = [p.replace(r"\s", r"[\s\x1c-\x1f]").encode("ascii") for p in patterns]
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    database.compile(
+        expressions=expressions,
+        ids=list(range(len(expressions))),
+        flags=[flags] * len(expressions),
+    )
+    return database
+
+
+_LEADING_WORD_RUN = r"\w*"
+
+
+def _fuse_sql_patterns(patterns: List[str]) -> str:
+    """Join patterns into one case-insensitive alternation for search().
+    
+    A leading ``\\w*`` only extends a match to the left and never decides
+    whether one exists, so it is dropped; kept, it backtracks quadratically
+    over long runs of word characters.
+    """
+    return "(?i)" + "|".join(
+        f"(?:{p.removeprefix(_LEADING_WORD_RUN)})" for p in patterns
+    )
+
+
+# Hyperscan scratch space may not be shared between concurrent scans
+_hs_local = threading.local()
+
+
+def _hs_stop(*_args: Any) -> bool:
+    """Hyperscan match handler that halts the scan at the first match."""
+    return True
+
+
+def _hs_search(database: Any, value: str) -> bool:
+    """Scan ASCII text with a Hyperscan database using a per-thread scratch."""
+    scratch = getattr(_hs_local, "scratch", None)
+    if scratch is None:
+        scratch = _hs_local.scratch = hyperscan.Scratch(database)
+    try:
+        database.scan(value.encode("ascii"), match_event_handler=_hs_stop, scratch=scratch)
+    except hyperscan.ScanTerminated:
+        return True
+    return False
+
+
+# http(s) scheme plus a host character, then no whitespace; linear-time with no
+# nested quantifiers, unlike the backtracking Validator.URL_PATTERN
+_URL_RE = re.compile(r"^https?://[^\s/$.?#]\S*$", re.IGNORECASE)
+
+# Job categories users can subscribe to, in display order
+_CATEGORY_NAMES = ("jobs", "remote", "internships", "scholarships")
+
+
+class ValidationResult(NamedTuple):
+    """Result of validation operation (immutable, tuple-backed)."""
     is_valid: bool
     value: Any
     error_message: Optional[str] = None
 
 
+@dataclass(slots=True)
+class JobsBatch:
+    """Validated jobs stored column-wise, one list per field.
+    
+    Iterating or indexing yields (title, company, link) rows, slicing yields
+    a smaller batch, and a batch compares equal to a list of the same rows,
+    so code written against the old list-of-tuples value keeps working while
+    bulk consumers can use the columns directly.
+    """
+    titles: List[str]
+    companies: List[str]
+    urls: List[str]
+    
+    @classmethod
+    def from_rows(cls, rows: List[Tuple[str, str, str]]) -> 'JobsBatch':
+        """Transpose (title, company, link) rows into columns."""
+        if not rows:
+            return cls([], [], [])
+        titles, companies, urls = map(list, zip(*rows))
+        return cls(titles, companies, urls)
+    
+    def __len__(self) -> int:
+        return len(self.titles)
+    
+    def __iter__(self) -> Iterator[Tuple[str, str, str]]:
+        return zip(self.titles, self.companies, self.urls)
+    
+    @overload
+    def __getitem__(self, index: int) -> Tuple[str, str, str]: ...
+    
+    @overload
+    def __getitem__(self, index: slice) -> 'JobsBatch': ...
+    
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Tuple[str, str, str], 'JobsBatch']:
+        if isinstance(index, slice):
+            return JobsBatch(self.titles[index], self.companies[index], self.urls[index])
+        return self.titles[index], self.companies[index], self.urls[index]
+    
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, JobsBatch):
+            return (
+                self.titles == other.titles
+                and self.companies == other.companies
+                and self.urls == other.urls
+            )
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+
+# Shared results for fixed error messages; ValidationResult is immutable, so
+# failed validations can return these instead of allocating a new one
+_ERR_USER_ID_REQUIRED = ValidationResult(False, None, "User ID is required")
+_ERR_USER_ID_NOT_POSITIVE = ValidationResult(False, None, "User ID must be positive")
+_ERR_USER_ID_NOT_INTEGER = ValidationResult(False, None, "User ID must be a valid integer")
+_ERR_USERNAME_REQUIRED = ValidationResult(False, None, "Username is required")
+_ERR_USERNAME_EMPTY = ValidationResult(False, None, "Username cannot be empty")
+_ERR_USERNAME_INVALID = ValidationResult(False, None, "Invalid characters in username")
+_ERR_URL_REQUIRED = ValidationResult(False, None, "URL is required")
+_ERR_URL_TOO_LONG = ValidationResult(False, None, "URL too long (max 500 chars)")
+_ERR_URL_FORMAT = ValidationResult(False, None, "Invalid URL format")
+_ERR_URL_INVALID = ValidationResult(False, None, "Invalid characters in URL")
+_ERR_TITLE_REQUIRED = ValidationResult(False, None, "Job title is required")
+_ERR_TITLE_TOO_SHORT = ValidationResult(False, None, "Job title too short")
+_ERR_TITLE_INVALID = ValidationResult(False, None, "Invalid characters in job title")
+_ERR_COMPANY_REQUIRED = ValidationResult(False, None, "Company name is required")
+_ERR_COMPANY_EMPTY = ValidationResult(False, None, "Company name cannot be empty")
+_ERR_COMPANY_INVALID = ValidationResult(False, None, "Invalid characters in company name")
+_ERR_CATEGORY_REQUIRED = ValidationResult(False, None, "Category is required")
+_ERR_MESSAGE_REQUIRED = ValidationResult(False, None, "Message text is required")
+_ERR_MESSAGE_EMPTY = ValidationResult(False, None, "Message cannot be empty")
+_ERR_MESSAGE_INVALID = ValidationResult(False, None, "Invalid characters in message")
+_ERR_NO_USERS = ValidationResult(False, None, "No users provided")
+_ERR_USER_FORMAT = ValidationResult(False, None, "Invalid user format")
+_ERR_NO_JOBS = ValidationResult(False, None, "No jobs provided")
+_ERR_JOB_FORMAT = ValidationResult(False, None, "Invalid job format")
+_ERR_NO_VALID_JOBS = ValidationResult(False, None, "No valid jobs in batch")
+_ERR_INVALID_CATEGORY = ValidationResult(
+    False, None, f"Invalid category. Must be one of: {', '.join(_CATEGORY_NAMES)}"
+)
+
+# Prebuilt success results keyed by canonical category name
+_CATEGORY_RESULTS = {name: ValidationResult(True, name) for name in _CATEGORY_NAMES}
+
+
 class Validator:
     """Input validation utilities."""
     
@@ -35,13 +257,19 @@ class Validator:
         r'((\%3D)|(=))[^\n]*((\%27)|(\')|(\-\-)|(\%3B)|(;))',
         r'\w*((\%27)|(\'))((\%6F)|o|(\%4F))((\%72)|r|(\%52))',
         r'((\%27)|(\'))union',
-        r'exec(\s|\+)+(s|x)p\w+',
+        r'exec(\s|\+)+(s|x)p_\w+',  # Stored procedures (sp_who, xp_cmdshell)
         r'UNION SELECT',
         r'INSERT INTO',
         r'DELETE FROM',
         r'DROP TABLE',
     ]
     
+    # All SQL injection patterns fused into one case-insensitive alternation
+    _SQL_INJECTION_RE = _sql_re.compile(_fuse_sql_patterns(SQL_INJECTION_PATTERNS))
+    
+    # Optional Hyperscan database over the same patterns, used for ASCII input
+    _SQL_INJECTION_HS = _build_sql_scanner(SQL_INJECTION_PATTERNS)
+    
     @classmethod
     def validate_telegram_id(cls, user_id: Any) -> ValidationResult:
         """Validate Telegram user ID.
@@ -52,16 +280,39 @@ class Validator:
         Returns:
             ValidationResult with validation status
         """
+        # The same users are validated on every command and broadcast, so
+        # results are memoized. Only plain ints and strings short enough to be
+        # an ID are cached; anything else is checked directly
+        if type(user_id) is int or (type(user_id) is str and len(user_id) <= 19):
+            return cls._cached_telegram_id(user_id)
+        return cls._check_telegram_id(user_id)
+    
+    @classmethod
+    def _check_telegram_id(cls, user_id: Any) -> ValidationResult:
+        """Validate Telegram user ID without consulting the cache."""
         if user_id is None:
-            return ValidationResult(False, None, "User ID is required")
+            return _ERR_USER_ID_REQUIRED
         
-        try:
+        # Fast paths for plain ints and short digit-only strings skip exception
+        # setup; long strings still go through int() for its digit limit
+        if type(user_id) is int:
+            uid = user_id
+        elif type(user_id) is str and len(user_id) <= 19 and user_id.isdecimal():
             uid = int(user_id)
-            if uid <= 0:
-                return ValidationResult(False, None, "User ID must be positive")
-            return ValidationResult(True, uid)
-        except (ValueError, TypeError):
-            return ValidationResult(False, None, "User ID must be a valid integer")
+        else:
+            # Anything else int() accepts (padded strings, floats, bools)
+            try:
+                uid = int(user_id)
+            except (ValueError, TypeError):
+                return _ERR_USER_ID_NOT_INTEGER
+        
+        if uid <= 0:
+            return _ERR_USER_ID_NOT_POSITIVE
+        return ValidationResult(True, uid)
+    
+    _cached_telegram_id = classmethod(
+        lru_cache(maxsize=8192)(_check_telegram_id.__func__)
+    )
     
     @classmethod
     def validate_username(cls, username: Optional[str]) -> ValidationResult:
@@ -74,21 +325,18 @@ class Validator:
             ValidationResult with sanitized username
         """
         if not username:
-            return ValidationResult(False, None, "Username is required")
-        
-        # Sanitize
-        sanitized = html.escape(username.strip())
+            return _ERR_USERNAME_REQUIRED
         
-        # Check length
-        if len(sanitized) > 100:
-            sanitized = sanitized[:100]
+        # Sanitize and cap at 100 chars; escaping never shrinks text, so only
+        # the first 100 chars can survive truncation
+        sanitized = _fast_escape(username.strip()[:100])[:100]
         
         if len(sanitized) < 1:
-            return ValidationResult(False, None, "Username cannot be empty")
+            return _ERR_USERNAME_EMPTY
         
         # Check for SQL injection
         if cls._contains_sql_injection(sanitized):
-            return ValidationResult(False, None, "Invalid characters in username")
+            return _ERR_USERNAME_INVALID
         
         return ValidationResult(True, sanitized)
     
@@ -102,22 +350,10 @@ class Validator:
         Returns:
             ValidationResult with validation status
         """
-        if not url:
-            return ValidationResult(False, None, "URL is required")
-        
-        url = url.strip()
-        
-        if len(url) > 500:
-            return ValidationResult(False, None, "URL too long (max 500 chars)")
-        
-        if not cls.URL_PATTERN.match(url):
-            return ValidationResult(False, None, "Invalid URL format")
-        
-        # Check for SQL injection
-        if cls._contains_sql_injection(url):
-            return ValidationResult(False, None, "Invalid characters in URL")
-        
-        return ValidationResult(True, url)
+        value, error = cls._check_url(url)
+        if error:
+            return error
+        return ValidationResult(True, value)
     
     @classmethod
     def validate_job_title(cls, title: Optional[str]) -> ValidationResult:
@@ -129,22 +365,10 @@ class Validator:
         Returns:
             ValidationResult with sanitized title
         """
-        if not title:
-            return ValidationResult(False, None, "Job title is required")
-        
-        # Sanitize
-        sanitized = html.escape(title.strip())
-        
-        if len(sanitized) > 200:
-            sanitized = sanitized[:200]
-        
-        if len(sanitized) < 2:
-            return ValidationResult(False, None, "Job title too short")
-        
-        if cls._contains_sql_injection(sanitized):
-            return ValidationResult(False, None, "Invalid characters in job title")
-        
-        return ValidationResult(True, sanitized)
+        value, error = cls._check_job_title(title)
+        if error:
+            return error
+        return ValidationResult(True, value)
     
     @classmethod
     def validate_company_name(cls, company: Optional[str]) -> ValidationResult:
@@ -156,22 +380,90 @@ class Validator:
         Returns:
             ValidationResult with sanitized company name
         """
-        if not company:
-            return ValidationResult(False, None, "Company name is required")
+        value, error = cls._check_company_name(company)
+        if error:
+            return error
+        return ValidationResult(True, value)
+    
+    # The _check_* helpers return (value, None) or (None, shared error result)
+    # so batch validation allocates nothing per field. They are pure functions
+    # of their input, and scraped feeds resend the same listings every run,
+    # so results are memoized. Each helper bounds its input before the cached
+    # call, so a feed of huge strings can't pin them in the cache.
+    
+    @classmethod
+    def _check_url(cls, url: Optional[str]) -> Tuple[Optional[str], Optional[ValidationResult]]:
+        """Check URL format, returning (url, None) or (None, error result)."""
+        if not url:
+            return None, _ERR_URL_REQUIRED
+        
+        url = url.strip()
+        
+        if len(url) > 500:
+            return None, _ERR_URL_TOO_LONG
+        
+        return cls._cached_url(url)
+    
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _cached_url(cls, url: str) -> Tuple[Optional[str], Optional[ValidationResult]]:
+        """Check a stripped URL of at most 500 chars."""
+        # Length is already bounded, so the shape check is one linear match
+        if _URL_RE.match(url) is None:
+            return None, _ERR_URL_FORMAT
         
-        # Sanitize
-        sanitized = html.escape(company.strip())
+        # Check for SQL injection
+        if cls._contains_sql_injection(url):
+            return None, _ERR_URL_INVALID
         
-        if len(sanitized) > 100:
-            sanitized = sanitized[:100]
+        return url, None
+    
+    @classmethod
+    def _check_job_title(cls, title: Optional[str]) -> Tuple[Optional[str], Optional[ValidationResult]]:
+        """Check job title, returning (sanitized, None) or (None, error result)."""
+        if not title:
+            return None, _ERR_TITLE_REQUIRED
+        
+        # Escaping never shrinks text, so only the first 200 chars can survive
+        # truncation; the rest affects neither the result nor the cache key
+        return cls._cached_job_title(title.strip()[:200])
+    
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _cached_job_title(cls, title: str) -> Tuple[Optional[str], Optional[ValidationResult]]:
+        """Check a stripped job title of at most 200 chars."""
+        sanitized = _fast_escape(title)[:200]
+        
+        if len(sanitized) < 2:
+            return None, _ERR_TITLE_TOO_SHORT
+        
+        if cls._contains_sql_injection(sanitized):
+            return None, _ERR_TITLE_INVALID
+        
+        return sanitized, None
+    
+    @classmethod
+    def _check_company_name(cls, company: Optional[str]) -> Tuple[Optional[str], Optional[ValidationResult]]:
+        """Check company name, returning (sanitized, None) or (None, error result)."""
+        if not company:
+            return None, _ERR_COMPANY_REQUIRED
+        
+        # Only the first 100 chars can survive truncation
+        return cls._cached_company_name(company.strip()[:100])
+    
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _cached_company_name(cls, company: str) -> Tuple[Optional[str], Optional[ValidationResult]]:
+        """Check a stripped company name of at most 100 chars."""
+        sanitized = _fast_escape(company)[:100]
         
         if len(sanitized) < 1:
-            return ValidationResult(False, None, "Company name cannot be empty")
+            return None, _ERR_COMPANY_EMPTY
         
         if cls._contains_sql_injection(sanitized):
-            return ValidationResult(False, None, "Invalid characters in company name")
+            return None, _ERR_COMPANY_INVALID
         
-        return ValidationResult(True, sanitized)
+        return sanitized, None
     
     @classmethod
     def validate_category(cls, category: Optional[str]) -> ValidationResult:
@@ -183,21 +475,14 @@ class Validator:
         Returns:
             ValidationResult with validated category
         """
-        valid_categories = ["jobs", "remote", "internships", "scholarships"]
-        
         if not category:
-            return ValidationResult(False, None, "Category is required")
-        
-        category = category.strip().lower()
+            return _ERR_CATEGORY_REQUIRED
         
-        if category not in valid_categories:
-            return ValidationResult(
-                False, 
-                None, 
-                f"Invalid category. Must be one of: {', '.join(valid_categories)}"
-            )
-        
-        return ValidationResult(True, category)
+        # Canonical input (e.g. callback data) needs no normalization at all
+        result = _CATEGORY_RESULTS.get(category)
+        if result is None:
+            result = _CATEGORY_RESULTS.get(category.strip().casefold(), _ERR_INVALID_CATEGORY)
+        return result
     
     @classmethod
     def validate_message_text(cls, text: Optional[str], max_length: int = 4000) -> ValidationResult:
@@ -211,10 +496,13 @@ class Validator:
             ValidationResult with sanitized text
         """
         if not text:
-            return ValidationResult(False, None, "Message text is required")
+            return _ERR_MESSAGE_REQUIRED
+        
+        text = text.strip()
         
-        # Sanitize
-        sanitized = html.escape(text.strip())
+        # Only escape text within the limit; escaping never shrinks text, so
+        # oversized input is rejected below without being escaped at all
+        sanitized = _fast_escape(text) if len(text) <= max_length else text
         
         if len(sanitized) > max_length:
             return ValidationResult(
@@ -224,10 +512,10 @@ class Validator:
             )
         
         if len(sanitized) < 1:
-            return ValidationResult(False, None, "Message cannot be empty")
+            return _ERR_MESSAGE_EMPTY
         
         if cls._contains_sql_injection(sanitized):
-            return ValidationResult(False, None, "Invalid characters in message")
+            return _ERR_MESSAGE_INVALID
         
         return ValidationResult(True, sanitized)
     
@@ -241,11 +529,15 @@ class Validator:
         Returns:
             True if SQL injection detected
         """
-        value_upper = value.upper()
-        for pattern in cls.SQL_INJECTION_PATTERNS:
-            if re.search(pattern, value_upper):
-                return True
-        return False
+        # Clean ASCII input is cleared by the literal prefilter, and the remaining
+        # ASCII input goes to Hyperscan; non-ASCII always uses the regex since
+        # IGNORECASE folds characters that str.lower() and Hyperscan don't
+        if value.isascii():
+            if not _has_sql_literal(value):
+                return False
+            if cls._SQL_INJECTION_HS is not None:
+                return _hs_search(cls._SQL_INJECTION_HS, value)
+        return cls._SQL_INJECTION_RE.search(value) is not None
     
     @classmethod
     def sanitize_sql_input(cls, value: str) -> str:
@@ -281,7 +573,7 @@ class BatchValidator:
             ValidationResult
         """
         if not users:
-            return ValidationResult(False, None, "No users provided")
+            return _ERR_NO_USERS
         
         if len(users) > max_batch_size:
             return ValidationResult(
@@ -290,24 +582,29 @@ class BatchValidator:
                 f"Batch size exceeds maximum of {max_batch_size}"
             )
         
-        validated_users = []
-        for user in users:
-            if not isinstance(user, tuple) or len(user) != 2:
-                return ValidationResult(False, None, "Invalid user format")
-            
-            user_id, category = user
+        validate_id = Validator.validate_telegram_id
+        validate_category = Validator.validate_category
+        
+        validated_users: List[Any] = [None] * len(users)
+        for index, user in enumerate(users):
+            try:
+                user_id, category = user
+            except (TypeError, ValueError):
+                return _ERR_USER_FORMAT
             
-            # Validate user ID
-            id_result = Validator.validate_telegram_id(user_id)
-            if not id_result.is_valid:
-                return ValidationResult(False, None, f"Invalid user ID: {id_result.error_message}")
+            # Validate user ID; positive plain ints need no conversion
+            if type(user_id) is not int or user_id <= 0:
+                id_result = validate_id(user_id)
+                if not id_result.is_valid:
+                    return ValidationResult(False, None, f"Invalid user ID: {id_result.error_message}")
+                user_id = id_result.value
             
             # Validate category
-            cat_result = Validator.validate_category(category)
+            cat_result = validate_category(category)
             if not cat_result.is_valid:
                 return ValidationResult(False, None, f"Invalid category: {cat_result.error_message}")
             
-            validated_users.append((id_result.value, cat_result.value))
+            validated_users[index] = (user_id, cat_result.value)
         
         return ValidationResult(True, validated_users)
     
@@ -320,10 +617,10 @@ class BatchValidator:
             max_batch_size: Maximum batch size
             
         Returns:
-            ValidationResult
+            ValidationResult whose value is a JobsBatch of the valid jobs
         """
         if not jobs:
-            return ValidationResult(False, None, "No jobs provided")
+            return _ERR_NO_JOBS
         
         if len(jobs) > max_batch_size:
             return ValidationResult(
@@ -332,33 +629,69 @@ class BatchValidator:
                 f"Batch size exceeds maximum of {max_batch_size}"
             )
         
-        validated_jobs = []
+        validated_jobs = BatchValidator._validate_job_rows(jobs)
+        if isinstance(validated_jobs, ValidationResult):
+            return validated_jobs
+        
+        if not validated_jobs:
+            return _ERR_NO_VALID_JOBS
+        
+        return ValidationResult(True, JobsBatch.from_rows(validated_jobs))
+    
+    @staticmethod
+    def _validate_job_rows(jobs: List[Tuple[str, str, str]]) -> Any:
+        """Validate job rows, returning the valid ones or a format error result."""
+        check_title = Validator._check_job_title
+        check_company = Validator._check_company_name
+        check_url = Validator._check_url
+        
+        # Preallocate, fill valid rows from the front, then trim the tail once
+        validated_jobs: List[Any] = [None] * len(jobs)
+        count = 0
         for job in jobs:
             if not isinstance(job, tuple) or len(job) != 3:
-                return ValidationResult(False, None, "Invalid job format")
+                return _ERR_JOB_FORMAT
             
             title, company, link = job
             
             # Validate each field
-            title_result = Validator.validate_job_title(title)
-            if not title_result.is_valid:
+            title_value, title_error = check_title(title)
+            if title_error:
                 continue  # Skip invalid jobs
             
-            company_result = Validator.validate_company_name(company)
-            if not company_result.is_valid:
-                company_result.value = "Unknown"
+            company_value, company_error = check_company(company)
+            if company_error:
+                company_value = "Unknown"
             
-            link_result = Validator.validate_url(link)
-            if not link_result.is_valid:
+            link_value, link_error = check_url(link)
+            if link_error:
                 continue  # Skip invalid jobs
             
-            validated_jobs.append((
-                title_result.value,
-                company_result.value,
-                link_result.value
-            ))
+            validated_jobs[count] = (title_value, company_value, link_value)
+            count += 1
         
-        if not validated_jobs:
-            return ValidationResult(False, None, "No valid jobs in batch")
+        del validated_jobs[count:]
+        return validated_jobs
+    
+    # Batches larger than this are validated in a worker thread
+    ASYNC_OFFLOAD_THRESHOLD = 20
+    
+    @classmethod
+    async def validate_jobs_batch_async(
+        cls, jobs: List[Tuple[str, str, str]], max_batch_size: int = 100
+    ) -> ValidationResult:
+        """Validate a batch of jobs without blocking the event loop.
         
-        return ValidationResult(True, validated_jobs)
+        Small batches run inline; larger ones are offloaded with
+        ``asyncio.to_thread`` so escaping and regex scans don't stall other tasks.
+        
+        Args:
+            jobs: List of (title, company, link) tuples
+            max_batch_size: Maximum batch size
+            
+        Returns:
+            ValidationResult
+        """
+        if len(jobs) <= cls.ASYNC_OFFLOAD_THRESHOLD:
+            return cls.validate_jobs_batch(jobs, max_batch_size)
+        return await asyncio.to_thread(cls.validate_jobs_batch, jobs, max_batch_size)
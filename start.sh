@@ -9,4 +9,4 @@ echo "🚀 Starting Job Alert Bot with uvicorn..."
 export PYTHONPATH="${PYTHONPATH}:/opt/render/project/src"
 
 # Start uvicorn with proper configuration
-exec uvicorn asgi:app --host 0.0.0.0 --port $PORT --workers 1 --log-level info
\ No newline at end of file
+exec uvicorn asgi:app --host 0.0.0.0 --port $PORT --workers 1 --loop uvloop --log-level info
\ No newline at end of file
@@ -1,16 +1,11 @@
 """Pytest configuration and fixtures."""
 
-import sys
 import pytest
 import asyncio
 import tempfile
 import os
-from pathlib import Path
 from typing import Generator
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 
 @pytest.fixture(scope="session")
 def event_loop():
@@ -30,8 +25,9 @@ async def async_client():
 
 @pytest.fixture
 def temp_db_path() -> Generator[str, None, None]:
-    """Create temporary database file."""
-    fd, path = tempfile.mkstemp(suffix='.db')
+    """Create temporary database file, tagged with the xdist worker id."""
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    fd, path = tempfile.mkstemp(prefix=f"test_{worker}_", suffix='.db')
     os.close(fd)
     yield path
     os.unlink(path)
@@ -80,10 +76,15 @@ def mock_telegram_context():
     return context
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def reset_singletons():
-    """Reset singleton instances before each test."""
+    """Reset singleton instances after the test (opt in where a fresh registry matters)."""
     yield
+    from job_alert_bot.config import settings
+    from job_alert_bot.utils import circuit_breaker
+    
+    circuit_breaker._circuit_breakers.clear()
+    settings._config = None
 
 
 @pytest.fixture
@@ -2,12 +2,11 @@
 
 import pytest
 import asyncio
+import time
 from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
+from job_alert_bot.utils import circuit_breaker as circuit_breaker_module
 from job_alert_bot.utils.circuit_breaker import (
     CircuitBreaker,
     CircuitBreakerConfig,
@@ -36,6 +35,17 @@ class TestCircuitBreaker:
         """Create circuit breaker instance."""
         return CircuitBreaker("test_breaker", config)
     
+    @pytest.fixture
+    def fake_clock(self, monkeypatch):
+        """Replace the breaker's monotonic clock with a manually advanced one."""
+        clock = [1000.0]
+        monkeypatch.setattr(
+            circuit_breaker_module,
+            "time",
+            SimpleNamespace(monotonic=lambda: clock[0], time=time.time),
+        )
+        return clock
+    
     @pytest.mark.asyncio
     async def test_successful_call(self, breaker):
         """Test successful function call."""
@@ -58,66 +68,53 @@ class TestCircuitBreaker:
         assert breaker.failure_count == 1
         assert breaker.state == CircuitState.CLOSED
     
-    @pytest.mark.asyncio
-    async def test_circuit_opens_after_failures(self, breaker):
-        """Test circuit opens after threshold failures."""
+    @pytest.fixture
+    async def opened_breaker(self, breaker, fake_clock):
+        """Breaker driven past its failure threshold into the OPEN state."""
         async def fail_func():
             raise ValueError("Test error")
         
-        # Trigger failures
         for _ in range(3):
             with pytest.raises(ValueError):
                 await breaker.call(fail_func)
         
-        assert breaker.state == CircuitState.OPEN
-        
-        # Next call should fail immediately
-        with pytest.raises(CircuitBreakerOpenError):
-            await breaker.call(fail_func)
+        return breaker
     
     @pytest.mark.asyncio
-    async def test_circuit_half_open_recovery(self, breaker):
-        """Test circuit transitions to half-open and recovers."""
+    async def test_circuit_opens_after_failures(self, opened_breaker):
+        """Test circuit opens after threshold failures."""
         async def fail_func():
             raise ValueError("Test error")
         
-        async def success_func():
-            return "success"
-        
-        # Open the circuit
-        for _ in range(3):
-            with pytest.raises(ValueError):
-                await breaker.call(fail_func)
-        
-        assert breaker.state == CircuitState.OPEN
-        
-        # Wait for recovery timeout
-        await asyncio.sleep(0.15)
+        assert opened_breaker.state == CircuitState.OPEN
         
-        # Circuit should be half-open
-        result = await breaker.call(success_func)
-        assert result == "success"
-        assert breaker.state == CircuitState.CLOSED
+        # Next call should fail immediately
+        with pytest.raises(CircuitBreakerOpenError):
+            await opened_breaker.call(fail_func)
     
     @pytest.mark.asyncio
-    async def test_half_open_failure_reopens(self, breaker):
-        """Test that failure in half-open reopens circuit."""
-        async def fail_func():
-            raise ValueError("Test error")
-        
-        # Open the circuit
-        for _ in range(3):
-            with pytest.raises(ValueError):
-                await breaker.call(fail_func)
+    @pytest.mark.parametrize("probe_fails, expected_state", [
+        (False, CircuitState.CLOSED),
+        (True, CircuitState.OPEN),
+    ], ids=["half_open_recovery", "half_open_failure_reopens"])
+    async def test_half_open_probe(self, opened_breaker, fake_clock, probe_fails, expected_state):
+        """Test the half-open probe closes the circuit on success and reopens it on failure."""
+        async def probe():
+            if probe_fails:
+                raise ValueError("Test error")
+            return "success"
         
-        # Wait for recovery
-        await asyncio.sleep(0.15)
+        # Advance past the recovery timeout
+        fake_clock[0] += 0.15
+        await asyncio.sleep(0)
         
-        # Fail in half-open
-        with pytest.raises(ValueError):
-            await breaker.call(fail_func)
+        if probe_fails:
+            with pytest.raises(ValueError):
+                await opened_breaker.call(probe)
+        else:
+            assert await opened_breaker.call(probe) == "success"
         
-        assert breaker.state == CircuitState.OPEN
+        assert opened_breaker.state == expected_state
     
     def test_get_state(self, breaker):
         """Test getting circuit breaker state."""
@@ -126,8 +123,16 @@ class TestCircuitBreaker:
         assert state["state"] == "closed"
         assert state["failure_count"] == 0
         assert state["success_count"] == 0
+        assert state["last_failure_time"] is None
+    
+    def test_get_state_reports_wall_clock_failure_time(self, opened_breaker):
+        """Test the reported failure time is a Unix timestamp, not monotonic."""
+        state = opened_breaker.get_state()
+        assert state["last_failure_time"] == pytest.approx(time.time(), abs=5)
+        assert opened_breaker.last_failure_time == 1000.0
 
 
+@pytest.mark.usefixtures("reset_singletons")
 class TestCircuitBreakerRegistry:
     """Test cases for circuit breaker registry."""
     
@@ -174,12 +179,12 @@ class TestCircuitBreakerConcurrency:
         breaker = CircuitBreaker("concurrent_breaker", config)
         
         async def success_func():
-            await asyncio.sleep(0.01)
             return "success"
         
         # Make concurrent calls
-        tasks = [breaker.call(success_func) for _ in range(10)]
-        results = await asyncio.gather(*tasks)
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(breaker.call(success_func)) for _ in range(10)]
+        results = [task.result() for task in tasks]
         
         assert all(r == "success" for r in results)
         assert breaker.state == CircuitState.CLOSED
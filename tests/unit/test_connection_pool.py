@@ -0,0 +1,292 @@
+"""Unit tests for the database connection pool and transaction manager."""
+
+import pytest
+import queue
+import sqlite3
+import threading
+import time
+
+from job_alert_bot.database import connection_pool as connection_pool_module
+from job_alert_bot.database.connection_pool import (
+    ConnectionPool,
+    PoolConfig,
+    TransactionManager,
+    get_db_connection,
+    get_pool,
+    get_transaction_manager,
+    init_connection_pool,
+    transaction,
+)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Database file in a per-test directory, so WAL side files are cleaned up too."""
+    return str(tmp_path / "pool.db")
+
+
+def run_in_thread(func):
+    """Run func on a fresh thread and return its result."""
+    result = []
+    thread = threading.Thread(target=lambda: result.append(func()))
+    thread.start()
+    thread.join()
+    return result[0]
+
+
+class TestConnectionPool:
+    """Test cases for ConnectionPool with the default queue layout."""
+    
+    @pytest.fixture
+    def pool(self, db_path):
+        """Single-queue pool over a temp database."""
+        pool = ConnectionPool(db_path, PoolConfig(max_connections=2, timeout=0.05))
+        yield pool
+        pool.close_all()
+    
+    def test_connection_reused_after_return(self, pool):
+        """Test a returned connection is handed out again."""
+        conn = pool.get_connection()
+        pool.return_connection(conn)
+        assert pool.get_connection() is conn
+        assert pool._connections_created == 1
+    
+    def test_wait_times_out_at_capacity(self, pool):
+        """Test callers time out once every connection is checked out."""
+        pool.get_connection()
+        pool.get_connection()
+        with pytest.raises(queue.Empty):
+            pool.get_connection()
+    
+    def test_broken_connection_is_discarded(self, pool):
+        """Test broken connections are closed instead of pooled."""
+        conn = pool.get_connection()
+        pool.return_connection(conn, is_broken=True)
+        assert pool._connections_created == 0
+        assert pool._pool.empty()
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+    
+    def test_surplus_connection_closed_when_pool_full(self, db_path):
+        """Test returning more connections than the queue holds closes the extra."""
+        pool = ConnectionPool(db_path, PoolConfig(max_connections=1))
+        pool.return_connection(pool.get_connection())
+        extra = pool._create_connection()
+        pool.return_connection(extra)
+        assert pool._connections_created == 1
+        with pytest.raises(sqlite3.ProgrammingError):
+            extra.execute("SELECT 1")
+        pool.close_all()
+    
+    def test_close_all_drains_queue(self, pool):
+        """Test close_all closes idle connections."""
+        conn = pool.get_connection()
+        pool.return_connection(conn)
+        pool.close_all()
+        assert pool._pool.empty()
+        assert pool._connections_created == 0
+    
+    def test_acquire_returns_connection(self, pool):
+        """Test acquire hands the connection back on exit."""
+        with pool.acquire() as conn:
+            assert conn.execute("SELECT 1").fetchone()[0] == 1
+        assert pool.get_connection() is conn
+    
+    def test_acquire_discards_connection_on_error(self, pool):
+        """Test acquire treats a connection as broken when the block raises."""
+        with pytest.raises(ValueError):
+            with pool.acquire():
+                raise ValueError("Test error")
+        assert pool._connections_created == 0
+
+
+class TestTransactionManager:
+    """Test cases for TransactionManager."""
+    
+    @pytest.fixture
+    def manager(self, db_path):
+        """Transaction manager over a temp database with one table."""
+        pool = ConnectionPool(db_path)
+        with pool.acquire() as conn:
+            conn.execute("CREATE TABLE items (name TEXT)")
+        yield TransactionManager(pool)
+        pool.close_all()
+    
+    @staticmethod
+    def names(manager):
+        """Committed item names, read outside any transaction."""
+        with manager.pool.acquire() as conn:
+            return [row["name"] for row in conn.execute("SELECT name FROM items ORDER BY name")]
+    
+    def test_commit(self, manager):
+        """Test a clean block commits its writes."""
+        with manager.transaction() as conn:
+            conn.execute("INSERT INTO items VALUES ('a')")
+        assert self.names(manager) == ["a"]
+    
+    def test_rollback_on_error(self, manager):
+        """Test an exception rolls the whole transaction back."""
+        with pytest.raises(ValueError):
+            with manager.transaction() as conn:
+                conn.execute("INSERT INTO items VALUES ('a')")
+                raise ValueError("Test error")
+        assert self.names(manager) == []
+    
+    def test_nested_failure_rolls_back_to_savepoint(self, manager):
+        """Test a failing nested block only undoes its own writes."""
+        with manager.transaction() as outer:
+            outer.execute("INSERT INTO items VALUES ('outer')")
+            with pytest.raises(ValueError):
+                with manager.transaction() as inner:
+                    assert inner is outer
+                    inner.execute("INSERT INTO items VALUES ('inner')")
+                    raise ValueError("Test error")
+            with manager.transaction() as inner:
+                inner.execute("INSERT INTO items VALUES ('kept')")
+        assert self.names(manager) == ["kept", "outer"]
+    
+    def test_execute_with_retry_returns_rows(self, manager):
+        """Test queries run inside a transaction and return all rows."""
+        with manager.transaction() as conn:
+            conn.execute("INSERT INTO items VALUES ('a')")
+        assert [tuple(row) for row in manager.execute_with_retry("SELECT name FROM items")] == [("a",)]
+    
+    def test_execute_with_retry_retries_locked_database(self, manager, monkeypatch):
+        """Test "database is locked" errors are retried with backoff."""
+        sleeps = []
+        monkeypatch.setattr(time, "sleep", sleeps.append)
+        real_transaction = manager.transaction
+        attempts = []
+        
+        def flaky_transaction():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise sqlite3.OperationalError("database is locked")
+            return real_transaction()
+        
+        monkeypatch.setattr(manager, "transaction", flaky_transaction)
+        assert manager.execute_with_retry("SELECT name FROM items") == []
+        assert len(attempts) == 2
+        assert sleeps == [0.1]
+    
+    def test_execute_with_retry_raises_other_errors(self, manager):
+        """Test operational errors other than locking are not retried."""
+        with pytest.raises(sqlite3.OperationalError):
+            manager.execute_with_retry("SELECT * FROM missing_table")
+
+
+class TestGlobalPool:
+    """Test cases for the module-level pool helpers."""
+    
+    @pytest.fixture
+    def fresh_globals(self, monkeypatch):
+        """Start each test without a global pool and restore the old one after."""
+        monkeypatch.setattr(connection_pool_module, "_pool", None)
+        monkeypatch.setattr(connection_pool_module, "_transaction_manager", None)
+    
+    def test_uninitialized_access_raises(self, fresh_globals):
+        """Test the getters refuse to run before init_connection_pool."""
+        with pytest.raises(RuntimeError):
+            get_pool()
+        with pytest.raises(RuntimeError):
+            get_transaction_manager()
+    
+    def test_helpers_use_global_pool(self, fresh_globals, db_path):
+        """Test the context-manager helpers go through the initialized pool."""
+        pool = init_connection_pool(db_path)
+        assert get_pool() is pool
+        assert get_transaction_manager().pool is pool
+        
+        with transaction() as conn:
+            conn.execute("CREATE TABLE items (name TEXT)")
+            conn.execute("INSERT INTO items VALUES ('a')")
+        with get_db_connection() as conn:
+            assert conn.execute("SELECT name FROM items").fetchone()[0] == "a"
+        pool.close_all()
+
+
+class TestShardedConnectionPool:
+    """Test cases for ConnectionPool with shard_pool enabled."""
+    
+    @pytest.fixture
+    def make_pool(self, db_path, monkeypatch):
+        """Build four-shard pools over a temp database and close them afterwards."""
+        monkeypatch.setattr(connection_pool_module.os, "cpu_count", lambda: 4)
+        pools = []
+        
+        def factory(max_connections=4, timeout=1.0):
+            pool = ConnectionPool(
+                db_path,
+                PoolConfig(max_connections=max_connections, timeout=timeout, shard_pool=True),
+            )
+            pools.append(pool)
+            return pool
+        
+        yield factory
+        for pool in pools:
+            pool.close_all()
+    
+    def test_threads_get_distinct_shards(self, make_pool):
+        """Test threads are spread round-robin rather than by thread ident."""
+        pool = make_pool(max_connections=4)
+        indices = {run_in_thread(pool._shard_index) for _ in range(pool._shard_count)}
+        assert len(indices) == pool._shard_count
+    
+    def test_shard_index_is_stable_per_thread(self, make_pool):
+        """Test a thread keeps the shard it was first given."""
+        pool = make_pool()
+        assert pool._shard_index() == pool._shard_index()
+    
+    def test_connection_reused_from_own_shard(self, make_pool):
+        """Test a returned connection is handed back to the same thread."""
+        pool = make_pool()
+        conn = pool.get_connection()
+        pool.return_connection(conn)
+        assert pool.get_connection() is conn
+        assert pool._connections_created == 1
+    
+    def test_steals_from_sibling_shard(self, make_pool):
+        """Test a thread takes an idle connection parked on another shard."""
+        pool = make_pool(max_connections=2)
+        conn = pool.get_connection()
+        pool.return_connection(conn)
+        
+        assert run_in_thread(pool._shard_index) != pool._shard_index()
+        assert run_in_thread(pool.get_connection) is conn
+        assert pool._connections_created == 1
+    
+    def test_wait_times_out_at_capacity(self, make_pool):
+        """Test waiting for a connection raises queue.Empty after the timeout."""
+        pool = make_pool(max_connections=1, timeout=0.05)
+        pool.get_connection()
+        
+        with pytest.raises(queue.Empty):
+            pool.get_connection()
+        assert pool._waiters == 0
+    
+    def test_waiter_woken_by_return(self, make_pool):
+        """Test a blocked caller receives a connection returned by another thread."""
+        pool = make_pool(max_connections=1, timeout=5.0)
+        conn = pool.get_connection()
+        
+        def release_when_waiting():
+            while not pool._waiters:
+                time.sleep(0.001)
+            pool.return_connection(conn)
+        
+        releaser = threading.Thread(target=release_when_waiting)
+        releaser.start()
+        assert pool.get_connection() is conn
+        releaser.join()
+    
+    def test_close_all_drains_shards(self, make_pool):
+        """Test close_all closes idle connections held in every shard."""
+        pool = make_pool()
+        conns = [pool.get_connection() for _ in range(2)]
+        pool.return_connection(conns[0])
+        run_in_thread(lambda: pool.return_connection(conns[1]))
+        
+        pool.close_all()
+        
+        assert not any(pool._shards)
+        assert pool._connections_created == 0
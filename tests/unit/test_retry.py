@@ -0,0 +1,312 @@
+"""Unit tests for retry utilities."""
+
+import pytest
+
+from job_alert_bot.utils import retry as retry_module
+from job_alert_bot.utils.retry import (
+    AsyncRetryable,
+    RetryConfig,
+    RetryExhaustedError,
+    cached_retry,
+    retry,
+    retry_with_backoff,
+)
+
+
+@pytest.fixture
+def recorded_sleeps(monkeypatch):
+    """Replace asyncio.sleep in the retry module and record requested delays."""
+    delays = []
+    
+    async def fake_sleep(delay):
+        delays.append(delay)
+    
+    monkeypatch.setattr(retry_module.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+class TestRetryWithBackoff:
+    """Test cases for retry_with_backoff."""
+    
+    @pytest.mark.asyncio
+    async def test_backoff_grows_and_caps(self, monkeypatch):
+        """Test delays grow exponentially up to max_delay."""
+        delays = []
+        
+        async def fake_sleep(delay):
+            delays.append(delay)
+        
+        monkeypatch.setattr(retry_module.asyncio, "sleep", fake_sleep)
+        
+        async def fail_func():
+            raise ValueError("Test error")
+        
+        config = RetryConfig(max_attempts=6, base_delay=1.0, max_delay=10.0, jitter=False)
+        with pytest.raises(RetryExhaustedError):
+            await retry_with_backoff(fail_func, config)
+        
+        assert delays == [1.0, 2.0, 4.0, 8.0, 10.0]
+    
+    @pytest.mark.asyncio
+    async def test_full_jitter_stays_within_backoff(self, monkeypatch):
+        """Test jittered delays never exceed the exponential ceiling."""
+        delays = []
+        
+        async def fake_sleep(delay):
+            delays.append(delay)
+        
+        monkeypatch.setattr(retry_module.asyncio, "sleep", fake_sleep)
+        
+        async def fail_func():
+            raise ValueError("Test error")
+        
+        config = RetryConfig(max_attempts=4, base_delay=1.0, max_delay=10.0)
+        with pytest.raises(RetryExhaustedError):
+            await retry_with_backoff(fail_func, config)
+        
+        assert all(0 <= d <= cap for d, cap in zip(delays, [1.0, 2.0, 4.0]))
+    
+    @pytest.mark.asyncio
+    async def test_zero_attempts_raises(self):
+        """Test a config with no attempts never calls the function."""
+        async def func():
+            raise AssertionError("should not be called")
+        
+        with pytest.raises(RetryExhaustedError):
+            await retry_with_backoff(func, RetryConfig(max_attempts=0))
+
+
+class TestRetryDecorator:
+    """Test cases for retry decorator."""
+    
+    @pytest.mark.asyncio
+    async def test_succeeds_after_retries(self, recorded_sleeps):
+        """Test transient failures are retried and on_retry is notified."""
+        retries = []
+        call_count = 0
+        
+        @retry(max_attempts=3, base_delay=0.5, on_retry=lambda e, attempt: retries.append(attempt))
+        async def flaky(x):
+            nonlocal call_count
+            call_count += 1
+            if call_count < 3:
+                raise ValueError("Test error")
+            return x
+        
+        assert await flaky("ok") == "ok"
+        assert call_count == 3
+        assert retries == [1, 2]
+        assert len(recorded_sleeps) == 2
+    
+    @pytest.mark.asyncio
+    async def test_non_retryable_exception_propagates(self, recorded_sleeps):
+        """Test exceptions outside retryable_exceptions are raised immediately."""
+        call_count = 0
+        
+        @retry(retryable_exceptions=(ConnectionError,))
+        async def broken():
+            nonlocal call_count
+            call_count += 1
+            raise ValueError("Test error")
+        
+        with pytest.raises(ValueError):
+            await broken()
+        assert call_count == 1
+        assert recorded_sleeps == []
+    
+    @pytest.mark.asyncio
+    async def test_exhausted_retries_keep_last_exception(self, recorded_sleeps):
+        """Test the final failure is attached to RetryExhaustedError."""
+        @retry(max_attempts=2)
+        async def always_fails():
+            raise ConnectionError("down")
+        
+        with pytest.raises(RetryExhaustedError) as exc_info:
+            await always_fails()
+        assert isinstance(exc_info.value.last_exception, ConnectionError)
+        assert isinstance(exc_info.value.__cause__, ConnectionError)
+
+
+class TestCachedRetry:
+    """Test cases for cached_retry decorator."""
+    
+    @pytest.mark.asyncio
+    async def test_caches_successful_result(self):
+        """Test identical calls are served from cache."""
+        call_count = 0
+        
+        @cached_retry(base_delay=0)
+        async def fetch(x):
+            nonlocal call_count
+            call_count += 1
+            return x * 2
+        
+        assert await fetch(2) == 4
+        assert await fetch(2) == 4
+        assert await fetch(3) == 6
+        assert call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_negative_caches_exhausted_retries(self):
+        """Test exhausted retries are cached and fail fast."""
+        call_count = 0
+        
+        @cached_retry(max_attempts=2, base_delay=0)
+        async def fetch():
+            nonlocal call_count
+            call_count += 1
+            raise ValueError("Test error")
+        
+        with pytest.raises(RetryExhaustedError):
+            await fetch()
+        assert call_count == 2
+        
+        with pytest.raises(RetryExhaustedError) as exc_info:
+            await fetch()
+        assert call_count == 2
+        assert isinstance(exc_info.value.last_exception, ValueError)
+    
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refreshed(self):
+        """Test entries past their TTL trigger a new call."""
+        call_count = 0
+        
+        @cached_retry(base_delay=0, ttl=0)
+        async def fetch():
+            nonlocal call_count
+            call_count += 1
+            return call_count
+        
+        assert await fetch() == 1
+        assert await fetch() == 2
+    
+    @pytest.mark.asyncio
+    async def test_unhashable_args_bypass_cache(self):
+        """Test unhashable arguments are not cached."""
+        call_count = 0
+        
+        @cached_retry(base_delay=0)
+        async def fetch(items):
+            nonlocal call_count
+            call_count += 1
+            return len(items)
+        
+        assert await fetch([1, 2]) == 2
+        assert await fetch([1, 2]) == 2
+        assert call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_unhashable_kwargs_bypass_cache(self):
+        """Test unhashable keyword arguments are not cached."""
+        call_count = 0
+        
+        @cached_retry(base_delay=0)
+        async def fetch(items):
+            nonlocal call_count
+            call_count += 1
+            return len(items)
+        
+        assert await fetch(items=[1]) == 1
+        assert await fetch(items=[1]) == 1
+        assert call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used(self):
+        """Test the cache holds at most maxsize entries."""
+        calls = []
+        
+        @cached_retry(base_delay=0, maxsize=2)
+        async def fetch(x):
+            calls.append(x)
+            return x
+        
+        for x in (1, 2, 1, 3, 1, 2):
+            await fetch(x)
+        assert calls == [1, 2, 3, 2]
+        
+        fetch.cache_clear()
+        await fetch(1)
+        assert calls[-1] == 1
+
+
+class TestAsyncRetryable:
+    """Test cases for AsyncRetryable context manager."""
+    
+    @pytest.mark.asyncio
+    async def test_clean_exit(self):
+        """Test a successful block leaves the attempt count at zero."""
+        retryable = AsyncRetryable()
+        async with retryable:
+            pass
+        assert retryable.attempt == 0
+    
+    @pytest.mark.asyncio
+    async def test_retries_until_success(self, recorded_sleeps):
+        """Test retryable failures are suppressed until the block succeeds."""
+        retries = []
+        retryable = AsyncRetryable(
+            RetryConfig(max_attempts=3, on_retry=lambda e, attempt: retries.append(attempt))
+        )
+        outcomes = [ValueError("first"), ValueError("second"), None]
+        
+        for outcome in outcomes:
+            async with retryable:
+                if outcome:
+                    raise outcome
+                break
+        
+        assert retryable.attempt == 2
+        assert str(retryable.last_exception) == "second"
+        assert retries == [1, 2]
+        assert len(recorded_sleeps) == 2
+    
+    @pytest.mark.asyncio
+    async def test_non_retryable_exception_propagates(self, recorded_sleeps):
+        """Test exceptions outside retryable_exceptions are not suppressed."""
+        retryable = AsyncRetryable(RetryConfig(retryable_exceptions=(ConnectionError,)))
+        with pytest.raises(ValueError):
+            async with retryable:
+                raise ValueError("Test error")
+        assert retryable.attempt == 0
+        assert recorded_sleeps == []
+    
+    @pytest.mark.asyncio
+    async def test_exhausted_attempts_propagate(self, recorded_sleeps):
+        """Test the last failure is raised once max_attempts is reached."""
+        retryable = AsyncRetryable(RetryConfig(max_attempts=2))
+        
+        async with retryable:
+            raise ValueError("first")
+        with pytest.raises(ValueError, match="second"):
+            async with retryable:
+                raise ValueError("second")
+        
+        assert retryable.attempt == 2
+        assert len(recorded_sleeps) == 1
+    
+    @pytest.mark.asyncio
+    async def test_backoff_grows_and_caps(self, recorded_sleeps):
+        """Test delays grow exponentially up to max_delay across attempts."""
+        retryable = AsyncRetryable(
+            RetryConfig(max_attempts=6, base_delay=1.0, max_delay=10.0, jitter=False)
+        )
+        
+        with pytest.raises(ValueError):
+            while True:
+                async with retryable:
+                    raise ValueError("Test error")
+        
+        assert recorded_sleeps == [1.0, 2.0, 4.0, 8.0, 10.0]
+    
+    @pytest.mark.asyncio
+    async def test_full_jitter_stays_within_backoff(self, recorded_sleeps):
+        """Test jittered delays never exceed the exponential ceiling."""
+        retryable = AsyncRetryable(RetryConfig(max_attempts=4, base_delay=1.0, max_delay=10.0))
+        
+        with pytest.raises(ValueError):
+            while True:
+                async with retryable:
+                    raise ValueError("Test error")
+        
+        assert len(recorded_sleeps) == 3
+        assert all(0 <= d <= cap for d, cap in zip(recorded_sleeps, [1.0, 2.0, 4.0]))
@@ -0,0 +1,30 @@
+"""Unit tests for configuration loading."""
+
+import pytest
+
+from job_alert_bot.config.settings import Config, Environment
+
+
+class TestConfigFromEnv:
+    """Test cases for Config.from_env."""
+    
+    def test_missing_required_env_vars(self):
+        """Test that an empty environment is rejected."""
+        with pytest.raises(ValueError):
+            Config.from_env({})
+    
+    def test_reads_given_mapping(self):
+        """Test that values come from the supplied mapping, not os.environ."""
+        config = Config.from_env({
+            "ENVIRONMENT": "testing",
+            "TELEGRAM_TOKEN": "test_token",
+            "ADMIN_ID": "12345",
+            "DB_ENABLE_WAL": "false",
+            "CORS_ORIGINS": "https://a.example, https://b.example",
+        })
+        
+        assert config.environment == Environment.TESTING
+        assert config.telegram.token == "test_token"
+        assert config.telegram.admin_id == 12345
+        assert config.database.enable_wal is False
+        assert config.security.cors_origins == ["https://a.example", "https://b.example"]
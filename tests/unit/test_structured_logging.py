@@ -0,0 +1,137 @@
+"""Unit tests for structured logging utilities."""
+
+import pytest
+import json
+import logging
+
+from job_alert_bot.utils import structured_logging as structured_logging_module
+from job_alert_bot.utils.structured_logging import (
+    CustomJsonFormatter,
+    LogContext,
+    StructuredLogger,
+    clear_correlation_id,
+    get_correlation_id,
+    set_correlation_id,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_correlation_id():
+    """Start and end each test without a correlation ID in the context."""
+    clear_correlation_id()
+    yield
+    clear_correlation_id()
+
+
+@pytest.fixture
+def restore_record_factory():
+    """Put back the global LogRecord factory after the test."""
+    factory = logging.getLogRecordFactory()
+    yield
+    logging.setLogRecordFactory(factory)
+
+
+def make_record(message="hello"):
+    """Build a LogRecord through the current record factory."""
+    return logging.getLogRecordFactory()(
+        "test.logger", logging.INFO, __file__, 42, message, None, None, "test_func"
+    )
+
+
+class TestCorrelationId:
+    """Test cases for correlation ID helpers."""
+    
+    def test_get_generates_and_keeps_id(self):
+        """Test the first lookup creates an ID that later lookups reuse."""
+        cid = get_correlation_id()
+        assert get_correlation_id() == cid
+        assert len(cid.split("-")) == 3
+    
+    def test_generated_ids_are_unique(self):
+        """Test each generated ID gets a fresh sequence number."""
+        assert set_correlation_id() != set_correlation_id()
+    
+    def test_set_and_clear(self):
+        """Test an explicit ID is returned until cleared."""
+        assert set_correlation_id("req-1") == "req-1"
+        assert get_correlation_id() == "req-1"
+        clear_correlation_id()
+        assert get_correlation_id() != "req-1"
+    
+    def test_log_context_restores_previous_id(self):
+        """Test nested contexts restore the outer ID on exit."""
+        set_correlation_id("outer")
+        with LogContext("inner") as ctx:
+            assert ctx.cid == "inner"
+            assert get_correlation_id() == "inner"
+            with LogContext():
+                assert get_correlation_id() not in ("outer", "inner")
+            assert get_correlation_id() == "inner"
+        assert get_correlation_id() == "outer"
+
+
+class TestCustomJsonFormatter:
+    """Test cases for CustomJsonFormatter."""
+    
+    def test_record_fields(self, restore_record_factory):
+        """Test formatted records carry level, source and correlation ID."""
+        structured_logging_module._install_correlation_id_factory()
+        set_correlation_id("req-42")
+        formatter = CustomJsonFormatter('%(timestamp)s %(level)s %(name)s %(message)s')
+        
+        payload = json.loads(formatter.format(make_record()))
+        
+        assert payload["message"] == "hello"
+        assert payload["level"] == "INFO"
+        assert payload["logger"] == "test.logger"
+        assert payload["source"].endswith(":42")
+        assert payload["function"] == "test_func"
+        assert payload["correlation_id"] == "req-42"
+        assert payload["service"] == "job-alert-bot"
+    
+    def test_record_without_factory_uses_placeholder(self):
+        """Test records created without the factory get a placeholder ID."""
+        formatter = CustomJsonFormatter('%(message)s')
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "hi", None, None)
+        payload = json.loads(formatter.format(record))
+        assert payload["correlation_id"] == "no-correlation-id"
+    
+    def test_timestamp_format(self):
+        """Test timestamps are ISO-8601 UTC with microseconds, cached per second."""
+        formatter = CustomJsonFormatter('%(message)s')
+        assert formatter._format_timestamp(0.25) == "1970-01-01T00:00:00.250000"
+        assert formatter._format_timestamp(0.5) == "1970-01-01T00:00:00.500000"
+        assert formatter._format_timestamp(86400.0) == "1970-01-02T00:00:00.000000"
+    
+    def test_factory_installed_once(self, restore_record_factory):
+        """Test installing the factory twice does not wrap it twice."""
+        structured_logging_module._install_correlation_id_factory()
+        factory = logging.getLogRecordFactory()
+        structured_logging_module._install_correlation_id_factory()
+        assert logging.getLogRecordFactory() is factory
+
+
+class TestStructuredLogger:
+    """Test cases for StructuredLogger."""
+    
+    def test_plain_message(self, caplog):
+        """Test messages without extra fields are logged as-is."""
+        with caplog.at_level(logging.INFO, logger="structured.test"):
+            StructuredLogger("structured.test").info("plain")
+        assert caplog.records[-1].getMessage() == "plain"
+    
+    def test_extra_fields_serialized(self, caplog):
+        """Test extra fields are merged into a JSON message."""
+        with caplog.at_level(logging.WARNING, logger="structured.test"):
+            StructuredLogger("structured.test").warning("with extra", extra={"user_id": 7})
+        record = caplog.records[-1]
+        assert record.levelno == logging.WARNING
+        assert json.loads(record.getMessage()) == {"message": "with extra", "extra": {"user_id": 7}}
+    
+    def test_exception_flags_exc_info(self, caplog):
+        """Test exception() logs at ERROR and marks exc_info in the extra fields."""
+        with caplog.at_level(logging.ERROR, logger="structured.test"):
+            StructuredLogger("structured.test").exception("boom")
+        record = caplog.records[-1]
+        assert record.levelno == logging.ERROR
+        assert json.loads(record.getMessage())["extra"] == {"exc_info": True}
@@ -1,11 +1,8 @@
 """Unit tests for validation utilities."""
 
 import pytest
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
-from job_alert_bot.utils.validation import Validator, BatchValidator, ValidationResult
+from job_alert_bot.utils.validation import Validator, BatchValidator, ValidationResult, JobsBatch
 
 
 class TestValidator:
@@ -103,6 +100,42 @@ class TestValidator:
         result = Validator.validate_url(long_url)
         assert result.is_valid is False
     
+    def test_field_checks_are_memoized(self):
+        """Test repeated titles are served from the check cache."""
+        Validator._cached_job_title.cache_clear()
+        first = Validator.validate_job_title("Backend Engineer")
+        second = Validator.validate_job_title("Backend Engineer")
+        assert first == second
+        assert Validator._cached_job_title.cache_info().hits == 1
+    
+    def test_field_check_cache_keys_are_bounded(self):
+        """Test oversized input is truncated or rejected before the cache."""
+        Validator._cached_job_title.cache_clear()
+        Validator._cached_url.cache_clear()
+        
+        first = Validator.validate_job_title("A" * 200 + "B" * 10_000)
+        second = Validator.validate_job_title("A" * 200 + "C" * 10_000)
+        assert first == second
+        assert first.value == "A" * 200
+        assert Validator._cached_job_title.cache_info().hits == 1
+        
+        result = Validator.validate_url("https://example.com/" + "a" * 10_000)
+        assert result.error_message == "URL too long (max 500 chars)"
+        assert Validator._cached_url.cache_info().currsize == 0
+    
+    def test_telegram_id_is_memoized(self):
+        """Test repeated IDs hit the cache and other input bypasses it."""
+        Validator._cached_telegram_id.cache_clear()
+        first = Validator.validate_telegram_id(123456789)
+        assert Validator.validate_telegram_id(123456789) is first
+        assert Validator._cached_telegram_id.cache_info().hits == 1
+        
+        assert Validator.validate_telegram_id(True).value == 1
+        assert Validator.validate_telegram_id(bytearray(b"42")).value == 42
+        assert Validator.validate_telegram_id([1]).is_valid is False
+        assert Validator.validate_telegram_id("9" * 5000).is_valid is False
+        assert Validator._cached_telegram_id.cache_info().currsize == 1
+    
     def test_validate_job_title_valid(self):
         """Test valid job title validation."""
         result = Validator.validate_job_title("Software Engineer")
@@ -162,6 +195,19 @@ class TestValidator:
         result = Validator.validate_message_text(long_message)
         assert result.is_valid is False
     
+    def test_validation_result_is_tuple_backed(self):
+        """Test results carry no per-instance __dict__."""
+        result = ValidationResult(True, "value")
+        assert isinstance(result, tuple)
+        assert not hasattr(result, "__dict__")
+        assert result.error_message is None
+    
+    def test_fixed_errors_reuse_shared_result(self):
+        """Test failures with a fixed message return one shared result."""
+        assert Validator.validate_telegram_id(None) is Validator.validate_telegram_id(None)
+        assert Validator.validate_url("not_a_url") is Validator.validate_url("ftp://x")
+        assert Validator.validate_category("invalid").error_message.startswith("Invalid category")
+    
     def test_sql_injection_detection(self):
         """Test SQL injection pattern detection."""
         malicious_inputs = [
@@ -173,6 +219,60 @@ class TestValidator:
         for inp in malicious_inputs:
             result = Validator._contains_sql_injection(inp)
             assert result is True, f"Failed to detect SQL injection in: {inp}"
+    
+    def test_sql_injection_detection_case_insensitive(self):
+        """Test SQL injection detection does not depend on input case."""
+        for inp in ["drop table users", "union select * from passwords", "Delete From jobs"]:
+            assert Validator._contains_sql_injection(inp) is True, inp
+        assert Validator._contains_sql_injection("Senior Python Developer") is False
+    
+    def test_exec_pattern_requires_stored_procedure_prefix(self):
+        """Test job titles starting with "Exec" are not mistaken for exec sp_/xp_ calls."""
+        for title in ["Exec Specialist", "Exec Sponsor Lead", "Exec  Spa Manager"]:
+            assert Validator._contains_sql_injection(title) is False, title
+            assert Validator.validate_job_title(title).is_valid is True, title
+        for inp in ["exec sp_executesql", "EXEC xp_cmdshell"]:
+            assert Validator._contains_sql_injection(inp) is True, inp
+    
+    def test_sql_prefilter_needles_cover_patterns(self):
+        """Test every SQL injection match contains a prefilter literal."""
+        from job_alert_bot.utils.validation import _SQL_INJECTION_NEEDLES
+        
+        malicious_inputs = [
+            "'; DROP TABLE users; --",
+            "1 OR 1=1",
+            "admin'--",
+            "1; DELETE FROM users",
+            "UNION SELECT * FROM passwords",
+            "exec sp_who",
+            "a=1;",
+            "%27or%271",
+            "tag #1",
+        ]
+        for inp in malicious_inputs:
+            if Validator._SQL_INJECTION_RE.search(inp):
+                lowered = inp.lower()
+                assert any(needle in lowered for needle in _SQL_INJECTION_NEEDLES), inp
+    
+    def test_sql_injection_regex_drops_leading_word_run(self):
+        """Test the fused regex omits the backtracking-prone leading \\w*."""
+        assert not Validator._SQL_INJECTION_RE.pattern.startswith(r"(?i)(?:\w*")
+        assert r"|(?:\w*" not in Validator._SQL_INJECTION_RE.pattern
+        assert Validator._contains_sql_injection("x" * 4000 + "'or") is True
+    
+    def test_sql_injection_patterns_precompiled(self, monkeypatch):
+        """Test SQL injection detection never compiles patterns per call."""
+        import re
+        from job_alert_bot.utils import validation
+        
+        def fail_compile(*args, **kwargs):
+            raise AssertionError("pattern compiled on the hot path")
+        
+        monkeypatch.setattr(re, "compile", fail_compile)
+        monkeypatch.setattr(validation._sql_re, "compile", fail_compile)
+        
+        assert Validator._contains_sql_injection("1; DROP TABLE users") is True
+        assert Validator._contains_sql_injection("Senior Python Developer") is False
 
 
 class TestBatchValidator:
@@ -199,6 +299,18 @@ class TestBatchValidator:
         result = BatchValidator.validate_users_batch(users)
         assert result.is_valid is False
     
+    def test_validate_users_batch_too_large_skips_rows(self, monkeypatch):
+        """Test oversized batches are rejected before any row is validated."""
+        def fail(*args, **kwargs):
+            raise AssertionError("row validated before the batch size check")
+        
+        monkeypatch.setattr(Validator, "validate_telegram_id", fail)
+        monkeypatch.setattr(Validator, "validate_category", fail)
+        
+        result = BatchValidator.validate_users_batch([("bad", "jobs")] * 101)
+        assert result.is_valid is False
+        assert result.error_message == "Batch size exceeds maximum of 100"
+    
     def test_validate_users_batch_invalid_format(self):
         """Test invalid format users batch validation."""
         users = ["invalid_format"]
@@ -230,3 +342,63 @@ class TestBatchValidator:
         result = BatchValidator.validate_jobs_batch(jobs)
         assert result.is_valid is True
         assert len(result.value) == 2  # One invalid job skipped
+    
+    def test_validate_jobs_batch_columns(self):
+        """Test valid jobs are exposed column-wise and as rows."""
+        jobs = [
+            ("Software Engineer", "Acme Corp", "https://example.com/job/1"),
+            ("Data Scientist", "Tech Inc", "https://example.com/job/2"),
+        ]
+        result = BatchValidator.validate_jobs_batch(jobs)
+        assert isinstance(result.value, JobsBatch)
+        assert result.value.titles == ["Software Engineer", "Data Scientist"]
+        assert result.value.urls == ["https://example.com/job/1", "https://example.com/job/2"]
+        assert list(result.value) == jobs
+        assert result.value[1] == jobs[1]
+    
+    def test_jobs_batch_slices_and_compares_as_rows(self):
+        """Test slicing returns a batch and batches compare equal to row lists."""
+        jobs = [
+            ("Software Engineer", "Acme Corp", "https://example.com/job/1"),
+            ("Data Scientist", "Tech Inc", "https://example.com/job/2"),
+        ]
+        batch = JobsBatch.from_rows(jobs)
+        assert batch == jobs
+        assert batch[0:1] == jobs[0:1]
+        assert isinstance(batch[0:1], JobsBatch)
+        assert batch[::-1].titles == ["Data Scientist", "Software Engineer"]
+        assert batch == JobsBatch.from_rows(jobs)
+        assert batch != jobs[:1]
+    
+    def test_validate_jobs_batch_large_preserves_order(self):
+        """Test large batches keep input order and skip only invalid rows."""
+        jobs = [(f"Engineer {i}", "Acme Corp", f"https://example.com/job/{i}") for i in range(100)]
+        jobs[57] = ("X", "Acme Corp", "https://example.com/job/57")  # title too short
+        result = BatchValidator.validate_jobs_batch(jobs)
+        assert result.is_valid is True
+        assert [job[2] for job in result.value] == [
+            f"https://example.com/job/{i}" for i in range(100) if i != 57
+        ]
+    
+    def test_validate_jobs_batch_late_invalid_format(self):
+        """Test a malformed row at the end of a large batch fails the whole batch."""
+        jobs = [("Engineer", "Acme Corp", f"https://example.com/job/{i}") for i in range(99)]
+        jobs.append("invalid_format")
+        result = BatchValidator.validate_jobs_batch(jobs)
+        assert result.is_valid is False
+        assert result.error_message == "Invalid job format"
+    
+    @pytest.mark.asyncio
+    async def test_validate_jobs_batch_async(self):
+        """Test async batch validation inline and offloaded to a thread."""
+        small = [("Software Engineer", "Acme Corp", "https://example.com/job/1")]
+        result = await BatchValidator.validate_jobs_batch_async(small)
+        assert result.is_valid is True
+        assert len(result.value) == 1
+        
+        large = [
+            ("Software Engineer", "Acme Corp", f"https://example.com/job/{i}")
+            for i in range(BatchValidator.ASYNC_OFFLOAD_THRESHOLD + 1)
+        ]
+        result = await BatchValidator.validate_jobs_batch_async(large)
+        assert result == BatchValidator.validate_jobs_batch(large)